@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from blog.models import Category, Comment, Location, Post
+from blog.models import Category, Comment, ImageJob, Location, Post
 
 admin.site.empty_value_display = 'Не задано'
 
@@ -42,8 +42,27 @@ class PostAdmin(admin.ModelAdmin):
     list_filter = ('category',)
     list_display_links = ('title',)
 
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        return queryset.search(search_term), False
+
+
+class ImageJobAdmin(admin.ModelAdmin):
+    """Интерфейс для просмотра очереди обработки фото"""
+
+    list_display = (
+        'source',
+        'post',
+        'status',
+        'created_at',
+    )
+    list_filter = ('status',)
+    readonly_fields = ('post', 'source', 'error', 'created_at')
+
 
 admin.site.register(Category, CategoryAdmin)
 admin.site.register(Comment)
 admin.site.register(Post, PostAdmin)
 admin.site.register(Location)
+admin.site.register(ImageJob, ImageJobAdmin)
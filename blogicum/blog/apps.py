@@ -1,7 +1,30 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def restore_fts_triggers(using, **kwargs):
+    from django.db import connections
+
+    from blog.fts import ensure_fts_triggers
+
+    ensure_fts_triggers(connections[using])
+
+
+def create_deletion_counter(using, **kwargs):
+    from blog.models import DeletionCounter
+
+    DeletionCounter.objects.using(using).get_or_create(
+        pk=DeletionCounter.ROW_ID
+    )
 
 
 class BlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'blog'
     verbose_name = 'Блог'
+
+    def ready(self):
+        from blog import checks, db, signals  # noqa: F401
+
+        post_migrate.connect(restore_fts_triggers, sender=self)
+        post_migrate.connect(create_deletion_counter, sender=self)
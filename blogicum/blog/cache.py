@@ -0,0 +1,247 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Subquery
+from django.utils import timezone
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    quote_etag,
+)
+
+from blog.metrics import record_cache_access
+from blog.routers import read_from_primary
+from blog.models import (
+    Category,
+    DeletionCounter,
+    Location,
+    Post,
+    published_cutoff,
+    published_visible_from,
+)
+
+POST_CARD_GENERATION_KEY = "blog:post_card_generation"
+PAGE_GENERATION_KEY = "blog:page_generation"
+CATEGORY_GENERATION_KEY = "blog:category_generation"
+PROCESS_LOCAL_CACHE = "django.core.cache.backends.locmem.LocMemCache"
+
+
+def uses_process_local_cache():
+    """
+    Кэш по умолчанию живёт в памяти процесса.
+    Сброс поколений тогда не доходит до других воркеров
+    и до process_image_jobs.
+    """
+    return settings.CACHES["default"]["BACKEND"] == PROCESS_LOCAL_CACHE
+
+
+def _get_generation(key):
+    # Счётчик, вытесненный из кэша, начинается с текущего времени,
+    # а не с 1: иначе снова стали бы видны старые записи.
+    return cache.get_or_set(key, time.time_ns, None)
+
+
+def _bump_generation(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def get_post_card_generation():
+    """Текущее поколение кэша карточек публикаций."""
+    return _get_generation(POST_CARD_GENERATION_KEY)
+
+
+def invalidate_post_cards():
+    """Сбрасывает все закэшированные карточки публикаций."""
+    _bump_generation(POST_CARD_GENERATION_KEY)
+
+
+def invalidate_pages():
+    """Сбрасывает все закэшированные страницы ленты."""
+    _bump_generation(PAGE_GENERATION_KEY)
+
+
+def invalidate_categories():
+    """Сбрасывает закэшированные категории."""
+    _bump_generation(CATEGORY_GENERATION_KEY)
+
+
+def get_published_category(slug):
+    """
+    Опубликованная категория по slug или None.
+    Хранится в общем кэше до изменения любой категории; с кэшем
+    в памяти процесса каждый запрос читает её из базы, чтобы снятие
+    с публикации в другом воркере действовало сразу.
+    """
+    if uses_process_local_cache():
+        return Category.objects.filter(is_published=True, slug=slug).first()
+    generation = _get_generation(CATEGORY_GENERATION_KEY)
+    key = f"blog:category:{generation}:{slug}"
+    category = cache.get(key)
+    record_cache_access("category", category is not None)
+    if category is None:
+        category = Category.objects.filter(
+            is_published=True, slug=slug
+        ).first()
+        if category is not None:
+            cache.set(key, category, settings.BLOG_CATEGORY_CACHE_TIMEOUT)
+    return category
+
+
+def page_cache_timeout():
+    """
+    Время жизни страницы в кэше.
+    Не превышает времени до появления в выдаче ближайшей
+    отложенной публикации, чтобы она появилась в ленте вовремя.
+    """
+    timeout = settings.BLOG_PAGE_CACHE_TIMEOUT
+    now = timezone.now()
+    # Публикация, дата которой прошла, скрыта до конца интервала
+    # округления, поэтому ищем следующую после границы выдачи.
+    next_pub_date = (
+        Post.objects.filter(
+            is_published=True, pub_date__gt=published_cutoff()
+        )
+        .order_by("pub_date")
+        .values_list("pub_date", flat=True)
+        .first()
+    )
+    if next_pub_date is not None:
+        visible_from = published_visible_from(next_pub_date)
+        seconds_left = (visible_from - now).total_seconds()
+        timeout = min(timeout, max(int(seconds_left), 1))
+    return timeout
+
+
+class AnonymousPageCacheMixin:
+    """
+    Кэширует страницу целиком для анонимных посетителей.
+    Сохранённая страница несёт свой ETag, поэтому на условный
+    запрос можно ответить 304 без обращения к базе.
+    """
+
+    def get_page_cache_key(self):
+        path = hashlib.md5(self.request.get_full_path().encode()).hexdigest()
+        return f"blog:page:{_get_generation(PAGE_GENERATION_KEY)}:{path}"
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method != "GET" or request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+        key = self.get_page_cache_key()
+        response = cache.get(key)
+        record_cache_access("page", response is not None)
+        if response is not None:
+            if "ETag" not in response.headers:
+                return response
+            return get_conditional_response(
+                request, etag=response.headers["ETag"], response=response
+            )
+        # Реплика может отставать от записи, которая только что сбросила
+        # поколение страниц: закэшированная с неё страница осталась бы
+        # устаревшей до истечения таймаута. Поэтому страница для кэша
+        # читается и отрисовывается с основной базы.
+        with read_from_primary():
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            if hasattr(response, "render"):
+                response.render()
+            cache.set(key, response, page_cache_timeout())
+        return response
+
+
+def latest(queryset, field):
+    """Подзапрос: наибольшее значение поля, выбираемое по индексу."""
+    return Subquery(queryset.order_by(f"-{field}").values(field)[:1])
+
+
+def feed_validators():
+    """
+    Подзапросы состояния ленты: последние изменения публикаций,
+    категорий и мест и последняя вышедшая публикация, чтобы
+    отложенная публикация сменила ETag в момент выхода.
+    """
+    return {
+        "posts_updated": latest(Post.objects.all(), "updated_at"),
+        "published": latest(
+            Post.objects.filter(
+                is_published=True, pub_date__lte=published_cutoff()
+            ),
+            "pub_date",
+        ),
+        "category_updated": latest(Category.objects.all(), "updated_at"),
+        "location_updated": latest(Location.objects.all(), "updated_at"),
+    }
+
+
+def page_validators(subqueries):
+    """
+    Состояние данных страницы одним запросом: счётчик удалений
+    и переданные подзапросы. Каждый подзапрос читает одну строку
+    по индексу, поэтому запрос не зависит от размера таблиц.
+    """
+    query = DeletionCounter.objects.filter(
+        pk=DeletionCounter.ROW_ID
+    ).values("value", **subqueries)
+    validators = query.first()
+    if validators is None:
+        DeletionCounter.objects.get_or_create(pk=DeletionCounter.ROW_ID)
+        validators = query.first()
+    return validators
+
+
+def page_etag(request, validators, extra=()):
+    """
+    Валидатор страницы блога: данные из базы, пользователь
+    (шапка страницы зависит от него) и адрес страницы.
+    """
+    raw = ":".join(map(str, (
+        *(validators[name] for name in sorted(validators)),
+        *extra,
+        request.user.pk,
+        getattr(request.user, "username", ""),
+        request.get_full_path(),
+    )))
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+class ConditionalGetMixin:
+    """
+    Отвечает 304 Not Modified, если данные страницы не изменились.
+    ETag строится по базе одним запросом, поэтому одинаков
+    во всех воркерах.
+    """
+
+    def get_validators(self):
+        """Подзапросы состояния данных, от которых зависит страница."""
+        return feed_validators()
+
+    def get_etag_extra(self):
+        """Прочие данные страницы, не связанные с публикациями."""
+        return ()
+
+    def get_etag(self):
+        validators = page_validators(self.get_validators())
+        return quote_etag(
+            page_etag(self.request, validators, self.get_etag_extra())
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+        etag = self.get_etag()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response.headers["ETag"] = etag
+        if request.user.is_authenticated:
+            patch_cache_control(response, private=True, no_cache=True)
+        else:
+            patch_cache_control(response, no_cache=True)
+        return response
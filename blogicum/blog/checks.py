@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+from blog.cache import uses_process_local_cache
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """Без общего кэша сброс кэша страниц не доходит до других воркеров."""
+    if settings.DEBUG or not uses_process_local_cache():
+        return []
+    return [
+        Warning(
+            "Кэш страниц, карточек и категорий хранится в LocMemCache: "
+            "изменения, сделанные в одном процессе, не сбрасывают кэш "
+            "остальных воркеров и видны с опозданием.",
+            hint=(
+                "Настройте общий кэш (FileBasedCache, DatabaseCache, "
+                "Redis) в CACHES['default']."
+            ),
+            id="blog.W001",
+        )
+    ]
@@ -0,0 +1,12 @@
+from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+
+from blog.cache import get_post_card_generation
+
+
+def post_card_cache(request):
+    """Параметры кэширования карточек публикаций для шаблонов."""
+    return {
+        "post_card_cache_timeout": settings.POST_CARD_CACHE_TIMEOUT,
+        "post_card_generation": SimpleLazyObject(get_post_card_generation),
+    }
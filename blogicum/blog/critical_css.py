@@ -0,0 +1,75 @@
+import re
+
+COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+TEMPLATE_TAG_RE = re.compile(r"{%.*?%}|{{.*?}}", re.S)
+CLASS_ATTR_RE = re.compile(r'class="([^"]*)"')
+ID_ATTR_RE = re.compile(r'id="([\w-]+)"')
+HTML_TAG_RE = re.compile(r"<([a-z][a-z0-9]*)\b")
+SELECTOR_CLASS_RE = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+SELECTOR_ID_RE = re.compile(r"#(-?[_a-zA-Z][\w-]*)")
+SELECTOR_TAG_RE = re.compile(r"(?:^|[\s>+~(,])([a-z][a-z0-9]*)")
+SELECTOR_NOISE_RE = re.compile(r"\[[^\]]*\]|::?[\w-]+")
+GROUPING_AT_RULES = ("@media", "@supports", "@layer", "@container")
+ALWAYS_USED_TAGS = {"html", "body"}
+
+
+class Vocabulary:
+    """Классы, id и теги, встречающиеся в шаблонах."""
+
+    def __init__(self, sources):
+        self.classes, self.ids, self.tags = set(), set(), set(
+            ALWAYS_USED_TAGS
+        )
+        for source in sources:
+            for value in CLASS_ATTR_RE.findall(source):
+                self.classes.update(TEMPLATE_TAG_RE.sub(" ", value).split())
+            self.ids.update(ID_ATTR_RE.findall(source))
+            self.tags.update(HTML_TAG_RE.findall(source))
+
+    def matches(self, selector):
+        """Селектор может сработать на разметке из шаблонов."""
+        if not set(SELECTOR_CLASS_RE.findall(selector)) <= self.classes:
+            return False
+        if not set(SELECTOR_ID_RE.findall(selector)) <= self.ids:
+            return False
+        bare = SELECTOR_NOISE_RE.sub(" ", selector)
+        bare = SELECTOR_CLASS_RE.sub(" ", SELECTOR_ID_RE.sub(" ", bare))
+        return set(SELECTOR_TAG_RE.findall(bare)) <= self.tags
+
+
+def split_rules(css):
+    """Разбивает CSS на пары (заголовок, тело) верхнего уровня."""
+    rules, depth, start, prelude = [], 0, 0, ""
+    for position, char in enumerate(css):
+        if char == "{":
+            if depth == 0:
+                prelude, start = css[start:position].strip(), position + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append((prelude, css[start:position]))
+                start = position + 1
+        elif char == ";" and depth == 0:
+            start = position + 1
+    return rules
+
+
+def extract_critical_css(css, vocabulary):
+    """Оставляет из таблицы стилей только правила для известной разметки."""
+    output = []
+    for prelude, body in split_rules(COMMENT_RE.sub("", css)):
+        if prelude.startswith(GROUPING_AT_RULES):
+            nested = extract_critical_css(body, vocabulary)
+            if nested:
+                output.append(f"{prelude}{{{nested}}}")
+        elif prelude.startswith("@"):
+            continue
+        else:
+            selectors = [
+                selector for selector in prelude.split(",")
+                if vocabulary.matches(selector)
+            ]
+            if selectors:
+                output.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(output)
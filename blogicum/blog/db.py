@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """
+    Настраивает новое соединение SQLite прагмами из SQLITE_PRAGMAS.
+    Прагмы выполняются на соединении sqlite3 в обход курсоров Django,
+    чтобы не попадать в бюджет запросов первого запроса на соединении.
+    """
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", None)
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+    for name, value in pragmas.items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
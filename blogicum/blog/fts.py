@@ -0,0 +1,58 @@
+"""
+Полнотекстовый индекс FTS5 для публикаций (только SQLite).
+
+SQLite пересоздаёт таблицу blog_post при изменении её схемы
+в миграциях, и триггеры индекса при этом теряются.
+Поэтому после каждой миграции они создаются заново.
+"""
+
+FTS_TRIGGERS = {
+    "blog_post_fts_insert": """
+        CREATE TRIGGER IF NOT EXISTS blog_post_fts_insert
+        AFTER INSERT ON blog_post BEGIN
+            INSERT INTO blog_post_fts(rowid, title, text)
+            VALUES (new.id, new.title, new.text);
+        END
+    """,
+    "blog_post_fts_delete": """
+        CREATE TRIGGER IF NOT EXISTS blog_post_fts_delete
+        AFTER DELETE ON blog_post BEGIN
+            INSERT INTO blog_post_fts(blog_post_fts, rowid, title, text)
+            VALUES ('delete', old.id, old.title, old.text);
+        END
+    """,
+    "blog_post_fts_update": """
+        CREATE TRIGGER IF NOT EXISTS blog_post_fts_update
+        AFTER UPDATE OF title, text ON blog_post BEGIN
+            INSERT INTO blog_post_fts(blog_post_fts, rowid, title, text)
+            VALUES ('delete', old.id, old.title, old.text);
+            INSERT INTO blog_post_fts(rowid, title, text)
+            VALUES (new.id, new.title, new.text);
+        END
+    """,
+}
+
+
+def ensure_fts_triggers(connection):
+    """Восстанавливает триггеры и перестраивает индекс, если их не было."""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+            " AND name = 'blog_post_fts'"
+        )
+        if cursor.fetchone() is None:
+            return
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            " AND tbl_name = 'blog_post'"
+        )
+        existing = {name for name, in cursor.fetchall()}
+        if existing >= FTS_TRIGGERS.keys():
+            return
+        for sql in FTS_TRIGGERS.values():
+            cursor.execute(sql)
+        cursor.execute(
+            "INSERT INTO blog_post_fts(blog_post_fts) VALUES ('rebuild')"
+        )
@@ -0,0 +1,80 @@
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+RENDITION_FORMATS = {
+    "webp": ("WEBP", "webp"),
+    "jpeg": ("JPEG", "jpg"),
+}
+
+
+def rendition_widths(original_width):
+    """Ширины вариантов: не больше исходной картинки."""
+    return sorted({
+        min(width, original_width)
+        for width in settings.POST_IMAGE_RENDITION_WIDTHS
+    })
+
+
+def _encode(image, image_format):
+    buffer = BytesIO()
+    image.save(
+        buffer,
+        format=image_format,
+        quality=settings.POST_IMAGE_RENDITION_QUALITY,
+    )
+    return ContentFile(buffer.getvalue())
+
+
+def strip_metadata(field_file):
+    """
+    Пересохраняет оригинал без EXIF (геометки, модель камеры),
+    повернув его согласно ориентации. Возвращает имя файла.
+    """
+    with field_file.open("rb"), Image.open(field_file) as original:
+        if not original.getexif():
+            return field_file.name
+        image_format = original.format
+        image = ImageOps.exif_transpose(original)
+        buffer = BytesIO()
+        image.save(buffer, format=image_format, quality=95)
+    return field_file.storage.save(
+        field_file.name, ContentFile(buffer.getvalue())
+    )
+
+
+def make_renditions(field_file):
+    """
+    Создаёт уменьшенные копии изображения в форматах WebP и JPEG
+    рядом с оригиналом и возвращает их описание для Post.renditions.
+    """
+    storage = field_file.storage
+    source = PurePosixPath(field_file.name)
+    with field_file.open("rb"), Image.open(field_file) as original:
+        image = ImageOps.exif_transpose(original).convert("RGB")
+    renditions = {"source": field_file.name}
+    for key, (image_format, extension) in RENDITION_FORMATS.items():
+        renditions[key] = []
+        for width in rendition_widths(image.width):
+            height = round(image.height * width / image.width)
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            name = storage.save(
+                str(
+                    source.parent / "renditions"
+                    / f"{source.stem}-{width}w.{extension}"
+                ),
+                _encode(resized, image_format),
+            )
+            renditions[key].append([width, name])
+    return renditions
+
+
+def srcset(renditions, key, storage):
+    """Значение атрибута srcset для одного формата."""
+    return ", ".join(
+        f"{storage.url(name)} {width}w"
+        for width, name in renditions.get(key, ())
+    )
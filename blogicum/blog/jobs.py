@@ -0,0 +1,129 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from PIL import Image
+
+from blog.cache import invalidate_pages, invalidate_post_cards
+from blog.images import make_renditions, strip_metadata
+from blog.models import ImageJob, Post
+
+logger = logging.getLogger(__name__)
+
+
+class ImageRejected(Exception):
+    """Загруженное фото не прошло проверку."""
+
+
+def delete_unreferenced_image(storage, name):
+    """Одинаковые фото хранятся одним файлом: удаляем последнюю ссылку."""
+    if not Post.objects.filter(image=name).exists():
+        storage.delete(name)
+
+
+def enqueue_image_job(post):
+    """Ставит фото публикации в очередь на обработку."""
+    job, _ = ImageJob.objects.get_or_create(
+        post=post,
+        source=post.image.name,
+        status=ImageJob.PENDING,
+    )
+    return job
+
+
+def requeue_stale_jobs():
+    """
+    Возвращает в очередь задачи, которые выполняются дольше
+    IMAGE_JOBS_RUNNING_TIMEOUT: их обработчик был остановлен.
+    """
+    stale_before = timezone.now() - timedelta(
+        seconds=settings.IMAGE_JOBS_RUNNING_TIMEOUT
+    )
+    return ImageJob.objects.filter(
+        status=ImageJob.RUNNING, started_at__lt=stale_before
+    ).update(status=ImageJob.PENDING, started_at=None)
+
+
+def claim_next_job():
+    """
+    Забирает первую задачу из очереди.
+    Статус меняется условным UPDATE, поэтому несколько
+    обработчиков не возьмут одну задачу дважды.
+    """
+    requeue_stale_jobs()
+    for job in ImageJob.objects.filter(status=ImageJob.PENDING)[:10]:
+        started_at = timezone.now()
+        claimed = ImageJob.objects.filter(
+            pk=job.pk, status=ImageJob.PENDING
+        ).update(status=ImageJob.RUNNING, started_at=started_at)
+        if claimed:
+            job.status = ImageJob.RUNNING
+            job.started_at = started_at
+            return job
+    return None
+
+
+def validate_image(field_file):
+    """Проверяет размер фото в пикселях, не декодируя его целиком."""
+    with field_file.open("rb"), Image.open(field_file) as image:
+        width, height = image.size
+    if width * height > settings.POST_IMAGE_MAX_PIXELS:
+        raise ImageRejected(
+            f"Фото {width}x{height} больше допустимого размера."
+        )
+
+
+def process_image_job(job):
+    """Проверяет фото, удаляет метаданные и готовит уменьшенные копии."""
+    post = Post.objects.filter(pk=job.post_id, image=job.source).first()
+    if post is None:
+        job.status = ImageJob.DONE
+        job.save(update_fields=("status",))
+        return
+    try:
+        validate_image(post.image)
+        image_name = strip_metadata(post.image)
+        post.image = image_name
+        renditions = make_renditions(post.image)
+    except (ImageRejected, OSError, Image.DecompressionBombError) as error:
+        Post.objects.filter(pk=post.pk, image=job.source).update(
+            image="", updated_at=timezone.now()
+        )
+        job.status = ImageJob.FAILED
+        job.error = str(error)
+    else:
+        Post.objects.filter(pk=post.pk, image=job.source).update(
+            image=image_name,
+            renditions=renditions,
+            updated_at=timezone.now(),
+        )
+        job.status = ImageJob.DONE
+        if image_name != job.source:
+            delete_unreferenced_image(post.image.storage, job.source)
+    job.save(update_fields=("status", "error"))
+    invalidate_post_cards()
+    invalidate_pages()
+
+
+def fail_job(job, error):
+    """Помечает задачу, упавшую с непредвиденной ошибкой."""
+    logger.exception("Не удалось обработать фото, задача %s", job.pk)
+    ImageJob.objects.filter(pk=job.pk).update(
+        status=ImageJob.FAILED, error=f"{type(error).__name__}: {error}"
+    )
+
+
+def run_pending_jobs(limit=None):
+    """Обрабатывает задачи из очереди; возвращает их количество."""
+    processed = 0
+    while limit is None or processed < limit:
+        job = claim_next_job()
+        if job is None:
+            break
+        try:
+            process_image_job(job)
+        except Exception as error:
+            fail_job(job, error)
+        processed += 1
+    return processed
@@ -0,0 +1,76 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+PROBE = """
+import json, os, time
+started = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+imported = time.perf_counter()
+from django.conf import settings
+from django.test import Client
+host = (settings.ALLOWED_HOSTS or ["localhost"])[0].lstrip(".")
+response = Client(HTTP_HOST=host).get(os.environ["BENCHMARK_PATH"])
+finished = time.perf_counter()
+print(json.dumps({
+    "import": imported - started,
+    "first_request": finished - imported,
+    "status": response.status_code,
+}))
+"""
+
+
+class Command(BaseCommand):
+    """Замеряет холодный старт проекта с разными настройками."""
+
+    help = (
+        "Запускает чистый интерпретатор для каждого модуля настроек "
+        "и выводит медианное время импорта и первого запроса."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "settings_modules",
+            nargs="*",
+            default=["blogicum.settings", "blogicum.settings_dev"],
+        )
+        parser.add_argument("--path", default="/")
+        parser.add_argument("--runs", type=int, default=5)
+
+    def probe(self, settings_module, path):
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": settings_module,
+            "BENCHMARK_PATH": path,
+        }
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(result.stdout.splitlines()[-1])
+
+    def handle(self, *args, **options):
+        for settings_module in options["settings_modules"]:
+            samples = [
+                self.probe(settings_module, options["path"])
+                for _ in range(options["runs"])
+            ]
+            imported = statistics.median(s["import"] for s in samples)
+            first = statistics.median(s["first_request"] for s in samples)
+            self.stdout.write(
+                f"{settings_module}: импорт {imported * 1000:.1f} мс, "
+                f"первый запрос {first * 1000:.1f} мс "
+                f"(статус {samples[-1]['status']})"
+            )
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import get_template
+
+from blog.critical_css import Vocabulary, extract_critical_css
+
+ABOVE_THE_FOLD_TEMPLATES = (
+    "base.html",
+    "includes/header.html",
+    "includes/footer.html",
+    "blog/index.html",
+    "includes/post_card.html",
+    "includes/paginator.html",
+)
+
+
+class Command(BaseCommand):
+    """Собирает критический CSS для встраивания в <head>."""
+
+    help = (
+        "Выбирает из локального Bootstrap правила, нужные разметке "
+        "первого экрана, и сохраняет их в BLOG_CRITICAL_CSS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "templates", nargs="*", default=ABOVE_THE_FOLD_TEMPLATES
+        )
+
+    def handle(self, *args, **options):
+        source = finders.find(settings.BLOG_BOOTSTRAP_CSS)
+        if source is None:
+            raise CommandError(
+                f"Не найден файл {settings.BLOG_BOOTSTRAP_CSS}."
+            )
+        vocabulary = Vocabulary(
+            get_template(name).template.source
+            for name in options["templates"]
+        )
+        with open(source, encoding="utf-8") as stylesheet:
+            critical = extract_critical_css(stylesheet.read(), vocabulary)
+        target = settings.STATICFILES_DIRS[0] / settings.BLOG_CRITICAL_CSS
+        target.write_text(critical + "\n", encoding="utf-8")
+        self.stdout.write(self.style.SUCCESS(
+            f"Критический CSS: {len(critical)} байт, {target}"
+        ))
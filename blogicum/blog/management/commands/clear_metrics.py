@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from blog.metrics import clear_metrics_dir
+
+
+class Command(BaseCommand):
+    """Очищает каталог METRICS_DIR."""
+
+    help = (
+        "Удаляет файлы метрик воркеров. Запускать перед стартом "
+        "сервера, когда ни один воркер ещё не работает."
+    )
+
+    def handle(self, *args, **options):
+        removed = clear_metrics_dir()
+        self.stdout.write(
+            self.style.SUCCESS(f"Удалено файлов метрик: {removed}")
+        )
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post, make_excerpt
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    """Заполняет сохранённое начало текста у публикаций."""
+
+    help = "Пересчитывает поле excerpt у всех публикаций."
+
+    def handle(self, *args, **options):
+        batch = []
+        updated = 0
+        for post in Post.objects.only("id", "text").iterator(BATCH_SIZE):
+            post.excerpt = make_excerpt(post.text)
+            batch.append(post)
+            if len(batch) == BATCH_SIZE:
+                updated += Post.objects.bulk_update(batch, ("excerpt",))
+                batch = []
+        if batch:
+            updated += Post.objects.bulk_update(batch, ("excerpt",))
+        self.stdout.write(
+            self.style.SUCCESS(f"Обновлено публикаций: {updated}")
+        )
@@ -0,0 +1,29 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from blog.jobs import run_pending_jobs
+
+
+class Command(BaseCommand):
+    """Фоновый обработчик очереди фото публикаций."""
+
+    help = "Обрабатывает очередь загруженных фото публикаций."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Обработать текущую очередь и завершиться.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            processed = run_pending_jobs()
+            if processed:
+                self.stdout.write(f"Обработано фото: {processed}")
+            if options["once"]:
+                return
+            if not processed:
+                time.sleep(settings.IMAGE_JOBS_POLL_INTERVAL)
@@ -0,0 +1,82 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+
+from blog.template_profiler import profile_templates
+
+DUMMY_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+}
+
+
+class Command(BaseCommand):
+    """Профилирует отрисовку шаблонов на страницах блога."""
+
+    help = (
+        "Запрашивает страницы тестовым клиентом и выводит полное "
+        "и собственное время каждого шаблона и include. "
+        "Стеки для флейм-графа сохраняются в --collapsed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+")
+        parser.add_argument("--repeat", type=int, default=10)
+        parser.add_argument("--user", help="Имя пользователя для входа.")
+        parser.add_argument(
+            "--collapsed",
+            help="Файл для стеков в формате flamegraph.pl.",
+        )
+        parser.add_argument(
+            "--with-cache",
+            action="store_true",
+            help="Не отключать кэш: страницы и карточки берутся из него.",
+        )
+
+    def get_client(self, username):
+        host = (settings.ALLOWED_HOSTS or ["localhost"])[0].lstrip(".")
+        client = Client(HTTP_HOST=host)
+        if username:
+            user = get_user_model().objects.filter(username=username).first()
+            if user is None:
+                raise CommandError(f"Пользователь {username} не найден.")
+            client.force_login(user)
+        return client
+
+    def handle(self, *args, **options):
+        client = self.get_client(options["user"])
+        caches = settings.CACHES if options["with_cache"] else DUMMY_CACHES
+        with override_settings(CACHES=caches), profile_templates() as profile:
+            for _ in range(options["repeat"]):
+                for path in options["paths"]:
+                    response = client.get(path)
+                    if response.status_code != 200:
+                        raise CommandError(
+                            f"{path}: ответ {response.status_code}."
+                        )
+        self.report(profile, options["repeat"])
+        if options["collapsed"]:
+            with open(options["collapsed"], "w") as output:
+                output.write(profile.collapsed())
+            self.stdout.write(f"Стеки записаны в {options['collapsed']}")
+
+    def report(self, profile, repeat):
+        self.stdout.write(
+            f"{'Шаблон':<40} {'вызовов':>8} {'всего, мс':>10} "
+            f"{'своё, мс':>10}  (на один проход)"
+        )
+        for name, cumulative in sorted(
+            profile.cumulative.items(), key=lambda item: -item[1]
+        ):
+            self.stdout.write(
+                f"{name:<40} {profile.calls[name] / repeat:>8.1f} "
+                f"{cumulative / repeat * 1000:>10.2f} "
+                f"{profile.own[name] / repeat * 1000:>10.2f}"
+            )
+        self.stdout.write("\nВложенные шаблоны:")
+        for (parent, name), cumulative in sorted(
+            profile.includes.items(), key=lambda item: -item[1]
+        ):
+            self.stdout.write(
+                f"{parent} → {name}: {cumulative / repeat * 1000:.2f} мс"
+            )
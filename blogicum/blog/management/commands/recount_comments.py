@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from blog.models import Comment, Post
+
+
+class Command(BaseCommand):
+    """Пересчитывает сохранённое количество комментариев у публикаций."""
+
+    help = "Пересчитывает поле comment_count у всех публикаций."
+
+    def handle(self, *args, **options):
+        comments = (
+            Comment.objects.filter(post=OuterRef("pk"))
+            .order_by()
+            .values("post")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        updated = Post.objects.update(
+            comment_count=Coalesce(
+                Subquery(comments, output_field=IntegerField()), 0
+            )
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Пересчитано публикаций: {updated}")
+        )
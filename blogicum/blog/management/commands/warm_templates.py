@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.template import TemplateSyntaxError
+
+from blog.template_cache import warm_templates
+
+
+class Command(BaseCommand):
+    """Компилирует все шаблоны проекта."""
+
+    help = (
+        "Разбирает все шаблоны из каталога templates/ и сообщает "
+        "об ошибках синтаксиса."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--app-dirs",
+            action="store_true",
+            help="Также компилировать шаблоны установленных приложений.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            warmed = warm_templates(app_dirs=options["app_dirs"])
+        except TemplateSyntaxError as error:
+            raise CommandError(f"Ошибка в шаблоне: {error}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Скомпилировано шаблонов: {warmed}")
+        )
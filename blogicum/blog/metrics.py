@@ -0,0 +1,200 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+HISTOGRAMS = {
+    "blog_request_duration_seconds": (
+        "Время обработки запроса по имени URL.", TIME_BUCKETS
+    ),
+    "blog_db_queries": ("SQL-запросов на один запрос.", COUNT_BUCKETS),
+    "blog_db_duration_seconds": (
+        "Время SQL-запросов на один запрос.", TIME_BUCKETS
+    ),
+    "blog_template_render_seconds": (
+        "Время отрисовки шаблона страницы.", TIME_BUCKETS
+    ),
+}
+COUNTERS = {
+    "blog_cache_requests_total": "Обращения к кэшу: попадания и промахи.",
+}
+
+
+def format_labels(labels):
+    """Набор меток в текстовом формате Prometheus."""
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n"),
+        )
+        for name, value in sorted(labels.items())
+    )
+
+
+class Registry:
+    """
+    Метрики одного процесса.
+    Если задан METRICS_DIR, состояние периодически сбрасывается
+    в файл <pid>-<время старта>.json, а /metrics суммирует файлы
+    всех воркеров. Файлы завершившихся воркеров не удаляются,
+    чтобы счётчики не уменьшались; каталог очищается командой
+    clear_metrics при перезапуске всего сервера.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self.flushed_at = 0.0
+        self.pid = None
+        self.started_at = None
+
+    @property
+    def filename(self):
+        """
+        Имя файла процесса.
+        Время старта отличает воркер от прежнего владельца того же PID.
+        """
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.started_at = time.time_ns()
+        return f"{self.pid}-{self.started_at}.json"
+
+    def inc(self, name, labels, amount=1):
+        key = (name, format_labels(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, labels, value):
+        key = (name, format_labels(labels))
+        buckets = HISTOGRAMS[name][1]
+        with self.lock:
+            sample = self.histograms.setdefault(
+                key, {"buckets": [0] * len(buckets), "sum": 0, "count": 0}
+            )
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    sample["buckets"][index] += 1
+            sample["sum"] += value
+            sample["count"] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "counters": [
+                    [name, labels, value]
+                    for (name, labels), value in self.counters.items()
+                ],
+                "histograms": [
+                    [name, labels, {**sample, "buckets": [*sample["buckets"]]}]
+                    for (name, labels), sample in self.histograms.items()
+                ],
+            }
+
+    def flush(self, force=False):
+        """Сохраняет состояние процесса для соседних воркеров."""
+        directory = settings.METRICS_DIR
+        now = time.monotonic()
+        if not directory or (
+            not force
+            and now - self.flushed_at < settings.METRICS_FLUSH_INTERVAL
+        ):
+            return
+        self.flushed_at = now
+        path = Path(directory) / self.filename
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.snapshot()))
+        os.replace(temporary, path)
+
+
+registry = Registry()
+
+
+def record_cache_access(cache_name, hit):
+    """Учитывает попадание или промах кэша."""
+    registry.inc(
+        "blog_cache_requests_total",
+        {"cache": cache_name, "result": "hit" if hit else "miss"},
+    )
+
+
+def collect_snapshots():
+    """Состояние текущего процесса и сохранённое состояние остальных."""
+    snapshots = [registry.snapshot()]
+    directory = settings.METRICS_DIR
+    if directory:
+        own = registry.filename
+        for path in Path(directory).glob("*.json"):
+            if path.name == own:
+                continue
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+    return snapshots
+
+
+def clear_metrics_dir():
+    """Удаляет сохранённые метрики всех воркеров."""
+    directory = settings.METRICS_DIR
+    removed = 0
+    if directory:
+        for path in Path(directory).glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def merge_snapshots(snapshots):
+    counters, histograms = {}, {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot["counters"]:
+            counters[name, labels] = counters.get((name, labels), 0) + value
+        for name, labels, sample in snapshot["histograms"]:
+            total = histograms.setdefault(
+                (name, labels),
+                {
+                    "buckets": [0] * len(sample["buckets"]),
+                    "sum": 0,
+                    "count": 0,
+                },
+            )
+            for index, value in enumerate(sample["buckets"]):
+                total["buckets"][index] += value
+            total["sum"] += sample["sum"]
+            total["count"] += sample["count"]
+    return counters, histograms
+
+
+def render_metrics():
+    """Метрики всех процессов в текстовом формате Prometheus."""
+    counters, histograms = merge_snapshots(collect_snapshots())
+    lines = []
+    for name, help_text in COUNTERS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for (sample_name, labels), value in sorted(counters.items()):
+            if sample_name == name:
+                lines.append(f"{name}{{{labels}}} {value}")
+    for name, (help_text, buckets) in HISTOGRAMS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for (sample_name, labels), sample in sorted(histograms.items()):
+            if sample_name != name:
+                continue
+            prefix = f"{labels}," if labels else ""
+            for bound, value in zip(buckets, sample["buckets"]):
+                lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {value}')
+            lines.append(
+                f'{name}_bucket{{{prefix}le="+Inf"}} {sample["count"]}'
+            )
+            lines.append(f"{name}_sum{{{labels}}} {sample['sum']}")
+            lines.append(f"{name}_count{{{labels}}} {sample['count']}")
+    return "\n".join(lines) + "\n"
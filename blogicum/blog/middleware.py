@@ -0,0 +1,198 @@
+import logging
+import mimetypes
+import os
+import time
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import MiddlewareNotUsed, SuspiciousFileOperation
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+from blog.metrics import registry
+from blog.query_budget import (
+    QueryBudgetExceeded,
+    count_queries,
+    view_query_budget,
+)
+from blog.routers import PRIMARY_COOKIE, replica_alias
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+STATIC_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+class ReplicaStickinessMiddleware:
+    """
+    После запроса на запись ставит cookie, по которой чтение
+    какое-то время идёт с основной базы: реплика может отставать.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in SAFE_METHODS and replica_alias():
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class QueryBudgetMiddleware:
+    """
+    Считает SQL-запросы и время работы с базой на каждый запрос.
+    Если представление объявило query_budget и превысило его,
+    пишет предупреждение в лог или, при QUERY_BUDGET_RAISE,
+    выбрасывает QueryBudgetExceeded. При SERVER_TIMING
+    числа попадают в заголовок Server-Timing.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.query_budget = None
+        with count_queries() as stats:
+            response = self.get_response(request)
+        request.query_stats = stats
+        budget = request.query_budget
+        if budget is not None and stats.count > budget:
+            message = (
+                f"{request.method} {request.path}: {stats.count} SQL-запросов "
+                f"при бюджете {budget}."
+            )
+            if settings.QUERY_BUDGET_RAISE:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        if settings.SERVER_TIMING:
+            response.headers["Server-Timing"] = (
+                f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries"'
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = view_query_budget(view_func)
+
+
+class MetricsMiddleware:
+    """
+    Собирает метрики запроса: время по имени URL и SQL-запросы
+    из QueryBudgetMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+        labels = {"view": self.view_name(request), "method": request.method}
+        registry.observe(
+            "blog_request_duration_seconds",
+            labels,
+            time.perf_counter() - started,
+        )
+        stats = getattr(request, "query_stats", None)
+        if stats is not None:
+            registry.observe("blog_db_queries", labels, stats.count)
+            registry.observe(
+                "blog_db_duration_seconds", labels, stats.duration
+            )
+        registry.flush()
+        return response
+
+    @staticmethod
+    def view_name(request):
+        match = getattr(request, "resolver_match", None)
+        return match.view_name if match else "unresolved"
+
+
+def accepted_encodings(request):
+    """Кодировки из Accept-Encoding, кроме явно запрещённых (q=0)."""
+    accepted = set()
+    for item in request.headers.get("Accept-Encoding", "").split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        if any(param.replace(" ", "") in ("q=0", "q=0.0") for param in params):
+            continue
+        if coding:
+            accepted.add(coding.lower())
+    return accepted
+
+
+class StaticFilesMiddleware:
+    """
+    Отдаёт собранную collectstatic статику из STATIC_ROOT,
+    не доходя до сессий, аутентификации и URL-ов.
+    Файлы с хэшем в имени кэшируются навсегда, сжатые копии
+    выбираются по заголовку Accept-Encoding.
+    """
+
+    def __init__(self, get_response):
+        if not settings.STATIC_ROOT:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.root = str(settings.STATIC_ROOT)
+        self.prefix = settings.STATIC_URL
+        immutable_names = getattr(staticfiles_storage, "immutable_names", None)
+        self.immutable = immutable_names() if immutable_names else frozenset()
+
+    def __call__(self, request):
+        if (
+            request.method not in ("GET", "HEAD")
+            or not request.path_info.startswith(self.prefix)
+        ):
+            return self.get_response(request)
+        name = request.path_info[len(self.prefix):]
+        try:
+            path = safe_join(self.root, name)
+        except SuspiciousFileOperation:
+            return self.get_response(request)
+        if not os.path.isfile(path):
+            return self.get_response(request)
+        return self.serve(request, name, path)
+
+    def serve(self, request, name, path):
+        stat = os.stat(path)
+        immutable = name in self.immutable
+        if not immutable and not was_modified_since(
+            request.headers.get("If-Modified-Since"), stat.st_mtime
+        ):
+            return HttpResponseNotModified()
+
+        served, encoding, compressed = path, None, False
+        accepted = accepted_encodings(request)
+        for coding, extension in STATIC_ENCODINGS:
+            if not os.path.isfile(path + extension):
+                continue
+            compressed = True
+            if encoding is None and coding in accepted:
+                served, encoding = path + extension, coding
+
+        content_type = mimetypes.guess_type(name)[0]
+        response = FileResponse(
+            open(served, "rb"),
+            content_type=content_type or "application/octet-stream",
+        )
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        if compressed:
+            patch_vary_headers(response, ("Accept-Encoding",))
+        response.headers["Last-Modified"] = http_date(stat.st_mtime)
+        if immutable:
+            response.headers["Cache-Control"] = (
+                f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+            )
+        else:
+            response.headers["Cache-Control"] = "public, no-cache"
+        return response
@@ -0,0 +1,60 @@
+from django.db import migrations
+
+CREATE_SQL = (
+    """
+    CREATE VIRTUAL TABLE blog_post_fts USING fts5(
+        title, text,
+        content='blog_post', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER blog_post_fts_insert AFTER INSERT ON blog_post BEGIN
+        INSERT INTO blog_post_fts(rowid, title, text)
+        VALUES (new.id, new.title, new.text);
+    END
+    """,
+    """
+    CREATE TRIGGER blog_post_fts_delete AFTER DELETE ON blog_post BEGIN
+        INSERT INTO blog_post_fts(blog_post_fts, rowid, title, text)
+        VALUES ('delete', old.id, old.title, old.text);
+    END
+    """,
+    """
+    CREATE TRIGGER blog_post_fts_update
+    AFTER UPDATE OF title, text ON blog_post BEGIN
+        INSERT INTO blog_post_fts(blog_post_fts, rowid, title, text)
+        VALUES ('delete', old.id, old.title, old.text);
+        INSERT INTO blog_post_fts(rowid, title, text)
+        VALUES (new.id, new.title, new.text);
+    END
+    """,
+    "INSERT INTO blog_post_fts(blog_post_fts) VALUES ('rebuild')",
+)
+
+DROP_SQL = (
+    "DROP TRIGGER IF EXISTS blog_post_fts_update",
+    "DROP TRIGGER IF EXISTS blog_post_fts_delete",
+    "DROP TRIGGER IF EXISTS blog_post_fts_insert",
+    "DROP TABLE IF EXISTS blog_post_fts",
+)
+
+
+def run_sqlite(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_post_image_storage'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_sqlite(CREATE_SQL), run_sqlite(DROP_SQL)),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.1 on 2026-10-17 04:15
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+BATCH_SIZE = 500
+
+
+def fill_excerpt(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    batch = []
+    for post in Post.objects.only('id', 'text').iterator(BATCH_SIZE):
+        post.excerpt = Truncator(post.text).words(10)
+        batch.append(post)
+        if len(batch) == BATCH_SIZE:
+            Post.objects.bulk_update(batch, ['excerpt'])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ['excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_post_fts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.TextField(blank=True, editable=False, verbose_name='Начало текста'),
+        ),
+        migrations.RunPython(fill_excerpt, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.1 on 2026-10-17 04:18
+
+import blog.models
+from django.db import migrations
+from django.db.models import F
+
+
+def fill_updated_at(apps, schema_editor):
+    for model_name in ('Category', 'Comment', 'Location', 'Post'):
+        model = apps.get_model('blog', model_name)
+        model.objects.update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_post_excerpt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='updated_at',
+            field=blog.models.UpdatedAtField(auto_now=True, db_index=True, verbose_name='Изменено'),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='updated_at',
+            field=blog.models.UpdatedAtField(auto_now=True, db_index=True, verbose_name='Изменено'),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='updated_at',
+            field=blog.models.UpdatedAtField(auto_now=True, db_index=True, verbose_name='Изменено'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='updated_at',
+            field=blog.models.UpdatedAtField(auto_now=True, db_index=True, verbose_name='Изменено'),
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+    ]
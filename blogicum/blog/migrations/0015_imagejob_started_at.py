@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-17 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imagejob',
+            name='started_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Начало обработки'),
+        ),
+    ]
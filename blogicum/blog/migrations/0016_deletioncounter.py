@@ -0,0 +1,24 @@
+# Generated by Django 5.1.1 on 2026-10-17 04:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_imagejob_started_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletionCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.PositiveBigIntegerField(default=0, verbose_name='Удалений')),
+            ],
+            options={
+                'verbose_name': 'счётчик удалений',
+                'verbose_name_plural': 'Счётчики удалений',
+            },
+        ),
+    ]
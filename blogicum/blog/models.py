@@ -1,17 +1,39 @@
+from datetime import timedelta
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import connection, models
+from django.db.models.expressions import RawSQL
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from blog.images import srcset
+from blog.storage import post_image_storage
 
 User = get_user_model()
 
 MAX_LENGTH = 256
+SNIPPET_START = "\x02"
+SNIPPET_END = "\x03"
 CHAR_LIMIT_COMMENT = 5
+EXCERPT_WORDS = 10
+
+
+class UpdatedAtField(models.DateTimeField):
+    """Дата последнего изменения записи, с индексом."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("auto_now", True)
+        kwargs.setdefault("db_index", True)
+        kwargs.setdefault("verbose_name", "Изменено")
+        super().__init__(*args, **kwargs)
 
 
 class PublishedCreated(models.Model):
     """
     Абстрактная модель.
-    Добавляет к модели дату создания и флаг публикации.
+    Добавляет к модели даты создания и изменения и флаг публикации.
     """
 
     is_published = models.BooleanField(
@@ -21,6 +43,7 @@ class PublishedCreated(models.Model):
     )
     created_at = models.DateTimeField(
         auto_now_add=True, verbose_name="Добавлено")
+    updated_at = UpdatedAtField()
 
     class Meta:
         abstract = True
@@ -62,12 +85,121 @@ class Location(PublishedCreated):
         return self.name
 
 
+def make_excerpt(text):
+    """Начало текста для карточки публикации в ленте."""
+    return Truncator(text).words(EXCERPT_WORDS)
+
+
+def fts_match_expression(query):
+    """Превращает строку поиска в запрос FTS5: все слова обязательны."""
+    terms = query.split()
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+def published_cutoff(bucket=None):
+    """
+    Момент, до которого публикации считаются вышедшими.
+    Округляется вниз до bucket секунд, чтобы запрос был одинаковым
+    в пределах интервала.
+    """
+    if bucket is None:
+        bucket = settings.BLOG_PUBLISHED_CUTOFF_BUCKET
+    now = timezone.now()
+    if not bucket:
+        return now
+    timestamp = now.timestamp()
+    return now - timedelta(seconds=timestamp % bucket)
+
+
+def published_visible_from(pub_date, bucket=None):
+    """
+    Момент, когда публикация с датой pub_date попадёт в выдачу:
+    граница published_cutoff округляется вниз, поэтому дата
+    округляется вверх до bucket секунд.
+    """
+    if bucket is None:
+        bucket = settings.BLOG_PUBLISHED_CUTOFF_BUCKET
+    if not bucket:
+        return pub_date
+    remainder = pub_date.timestamp() % bucket
+    if not remainder:
+        return pub_date
+    return pub_date + timedelta(seconds=bucket - remainder)
+
+
+class PostQuerySet(models.QuerySet):
+    """Запросы к публикациям."""
+
+    def published(self, bucket=None):
+        """Опубликованные публикации в опубликованных категориях."""
+        return self.filter(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=published_cutoff(bucket),
+        )
+
+    def last_modified(self, *args, **kwargs):
+        """Время последнего изменения публикаций из выборки."""
+        return self.filter(*args, **kwargs).aggregate(
+            last_modified=models.Max("updated_at")
+        )["last_modified"]
+
+    def search(self, query):
+        """
+        Полнотекстовый поиск по заголовку и тексту.
+        В SQLite использует индекс FTS5 blog_post_fts: добавляет
+        search_rank (bm25, меньше — лучше) и search_snippet.
+        """
+        if connection.vendor != "sqlite":
+            return self.filter(
+                models.Q(title__icontains=query)
+                | models.Q(text__icontains=query)
+            )
+        match = fts_match_expression(query)
+        if not match:
+            return self.none()
+        fts = (
+            "FROM blog_post_fts WHERE blog_post_fts MATCH %s"
+            " AND blog_post_fts.rowid = blog_post.id"
+        )
+        return self.filter(
+            id__in=RawSQL(
+                "SELECT rowid FROM blog_post_fts"
+                " WHERE blog_post_fts MATCH %s",
+                (match,),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT bm25(blog_post_fts, 2.0, 1.0) {fts}", (match,)
+            ),
+            search_snippet=RawSQL(
+                "SELECT snippet(blog_post_fts, -1, char(2), char(3),"
+                f" '…', 16) {fts}",
+                (match,),
+            ),
+        ).order_by("search_rank", "-pub_date")
+
+
+class PublishedPostManager(models.Manager.from_queryset(PostQuerySet)):
+    """Менеджер, возвращающий только вышедшие публикации."""
+
+    def get_queryset(self):
+        return super().get_queryset().published()
+
+
 class Post(PublishedCreated):
     """Модель для таблицы Публикации"""
 
     title = models.CharField(max_length=MAX_LENGTH, verbose_name="Заголовок")
     text = models.TextField(verbose_name="Текст")
-    image = models.ImageField("Фото", upload_to="images", blank=True)
+    excerpt = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name="Начало текста",
+    )
+    image = models.ImageField(
+        "Фото", upload_to="images", storage=post_image_storage, blank=True
+    )
     pub_date = models.DateTimeField(
         verbose_name="Дата и время публикации",
         help_text=(
@@ -96,18 +228,69 @@ class Post(PublishedCreated):
         related_name="posts",
         verbose_name="Категория",
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Количество комментариев",
+    )
+    renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Уменьшенные копии фото",
+    )
+
+    objects = PostQuerySet.as_manager()
+    published = PublishedPostManager()
 
     class Meta:
         verbose_name = "публикация"
         verbose_name_plural = "Публикации"
         ordering = ("-pub_date",)
+        indexes = (
+            models.Index(
+                fields=("-pub_date",),
+                condition=models.Q(is_published=True),
+                name="post_published_feed_idx",
+            ),
+            models.Index(
+                fields=("category", "-pub_date"),
+                condition=models.Q(is_published=True),
+                name="post_category_feed_idx",
+            ),
+            models.Index(
+                fields=("author", "-pub_date"),
+                name="post_author_feed_idx",
+            ),
+        )
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        self.excerpt = make_excerpt(self.text)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "text" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "excerpt"}
+        super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         return reverse("blog:post_detail", kwargs={"post_id": self.pk})
 
+    @property
+    def has_renditions(self):
+        return bool(self.image) and (
+            self.renditions.get("source") == self.image.name
+        )
+
+    @property
+    def webp_srcset(self):
+        return srcset(self.renditions, "webp", self.image.storage)
+
+    @property
+    def jpeg_srcset(self):
+        return srcset(self.renditions, "jpeg", self.image.storage)
+
 
 class Comment(models.Model):
     """Модель для комментариев к публикации"""
@@ -115,6 +298,7 @@ class Comment(models.Model):
     text = models.TextField("Текст комментария")
     created_at = models.DateTimeField(
         auto_now_add=True, verbose_name="Добавлено")
+    updated_at = UpdatedAtField()
     post = models.ForeignKey(
         Post,
         on_delete=models.CASCADE,
@@ -130,9 +314,90 @@ class Comment(models.Model):
         verbose_name = "комментарий"
         verbose_name_plural = "Комментарии"
         ordering = ("created_at",)
+        indexes = (
+            models.Index(
+                fields=("post", "created_at"),
+                name="comment_post_created_idx",
+            ),
+        )
 
     def __str__(self):
         return self.text[:CHAR_LIMIT_COMMENT]
 
     def get_absolute_url(self):
         return reverse("blog:post_detail", kwargs={"post_id": self.post.pk})
+
+
+class DeletionCounter(models.Model):
+    """
+    Число удалений публикаций, категорий, мест и комментариев.
+    Удаление не оставляет следа в updated_at, поэтому ETag
+    страниц учитывает его по этому счётчику.
+    """
+
+    ROW_ID = 1
+
+    value = models.PositiveBigIntegerField(default=0, verbose_name="Удалений")
+
+    class Meta:
+        verbose_name = "счётчик удалений"
+        verbose_name_plural = "Счётчики удалений"
+
+    def __str__(self):
+        return str(self.value)
+
+    @classmethod
+    def increment(cls):
+        """Учитывает ещё одно удаление."""
+        counter = cls.objects.filter(pk=cls.ROW_ID)
+        if not counter.update(value=models.F("value") + 1):
+            cls.objects.get_or_create(pk=cls.ROW_ID, defaults={"value": 1})
+
+
+class ImageJob(models.Model):
+    """Задача фоновой обработки фото публикации."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUSES = (
+        (PENDING, "В очереди"),
+        (RUNNING, "Выполняется"),
+        (DONE, "Готово"),
+        (FAILED, "Ошибка"),
+    )
+
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name="image_jobs",
+        verbose_name="Публикация",
+    )
+    source = models.CharField(max_length=MAX_LENGTH, verbose_name="Файл")
+    status = models.CharField(
+        max_length=16,
+        choices=STATUSES,
+        default=PENDING,
+        verbose_name="Статус",
+    )
+    error = models.TextField(blank=True, verbose_name="Ошибка")
+    created_at = models.DateTimeField(
+        auto_now_add=True, verbose_name="Добавлено")
+    started_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Начало обработки")
+
+    class Meta:
+        verbose_name = "обработка фото"
+        verbose_name_plural = "Обработка фото"
+        ordering = ("created_at",)
+        indexes = (
+            models.Index(
+                fields=("created_at",),
+                condition=models.Q(status="pending"),
+                name="imagejob_pending_idx",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.source} ({self.get_status_display()})"
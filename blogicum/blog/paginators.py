@@ -0,0 +1,143 @@
+import base64
+import binascii
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from django.http import Http404
+
+CURSOR_SEPARATOR = "|"
+
+
+class InvalidCursor(Exception):
+    """Курсор страницы не удалось разобрать."""
+
+
+def encode_cursor(moment, pk):
+    """Упаковывает позицию записи в непрозрачный токен."""
+    raw = f"{moment.isoformat()}{CURSOR_SEPARATOR}{pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """Возвращает пару (дата, id) из токена курсора."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        moment, pk = raw.rsplit(CURSOR_SEPARATOR, 1)
+        return datetime.fromisoformat(moment), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise InvalidCursor(token) from error
+
+
+class CursorPage:
+    """Страница курсорной пагинации: только ссылки вперёд и назад."""
+
+    is_cursor = True
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if self._has_next:
+            return self.paginator.cursor_for(self.object_list[-1])
+        return None
+
+    @property
+    def previous_cursor(self):
+        if self._has_previous:
+            return self.paginator.cursor_for(self.object_list[0])
+        return None
+
+
+class CursorPaginator:
+    """
+    Пагинатор по ключу (дата, id).
+    Не выполняет COUNT(*) и OFFSET: каждая страница выбирается
+    по индексу начиная с позиции последней показанной записи.
+    """
+
+    def __init__(
+            self, queryset, per_page, date_field="pub_date", descending=True
+    ):
+        self.date_field = date_field
+        self.descending = descending
+        self.queryset = queryset.order_by(*self.ordering(descending))
+        self.per_page = per_page
+
+    def ordering(self, descending):
+        sign = "-" if descending else ""
+        return (f"{sign}{self.date_field}", f"{sign}id")
+
+    def cursor_for(self, obj):
+        return encode_cursor(getattr(obj, self.date_field), obj.pk)
+
+    def beyond(self, token, forward):
+        """Условие «записи дальше курсора» в заданном направлении."""
+        moment, pk = decode_cursor(token)
+        lookup = "lt" if forward == self.descending else "gt"
+        return Q(**{f"{self.date_field}__{lookup}": moment}) | Q(
+            **{self.date_field: moment, f"id__{lookup}": pk}
+        )
+
+    def page(self, after=None, before=None):
+        if before is not None:
+            rows = list(
+                self.queryset.filter(self.beyond(before, forward=False))
+                .order_by(*self.ordering(not self.descending))
+                [:self.per_page + 1]
+            )
+            has_previous = len(rows) > self.per_page
+            object_list = rows[:self.per_page][::-1]
+            # Курсор взят со следующей страницы, поэтому она есть,
+            # если эта не пуста; пустая страница остаётся без ссылок.
+            return CursorPage(
+                object_list, self, bool(object_list), has_previous
+            )
+
+        queryset = self.queryset
+        if after is not None:
+            queryset = queryset.filter(self.beyond(after, forward=True))
+        rows = list(queryset[:self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        has_previous = after is not None and bool(rows)
+        return CursorPage(rows[:self.per_page], self, has_next, has_previous)
+
+
+class CursorPaginationMixin:
+    """
+    Переключает ListView на курсорную пагинацию,
+    если в настройках BLOG_PAGINATION_MODE = "cursor".
+    """
+
+    def paginate_queryset(self, queryset, page_size):
+        if getattr(settings, "BLOG_PAGINATION_MODE", "offset") != "cursor":
+            return super().paginate_queryset(queryset, page_size)
+        paginator = CursorPaginator(queryset, page_size)
+        try:
+            page = paginator.page(
+                after=self.request.GET.get("after"),
+                before=self.request.GET.get("before"),
+            )
+        except InvalidCursor:
+            raise Http404("Некорректный курсор страницы.")
+        return paginator, page, page.object_list, page.has_other_pages()
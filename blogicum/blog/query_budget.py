@@ -0,0 +1,44 @@
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+
+class QueryBudgetExceeded(Exception):
+    """Обработчик выполнил больше SQL-запросов, чем ему положено."""
+
+
+class QueryStats:
+    """Число SQL-запросов и суммарное время их выполнения."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+    @property
+    def duration_ms(self):
+        return self.duration * 1000
+
+
+@contextmanager
+def count_queries():
+    """Считает запросы ко всем базам внутри блока."""
+    stats = QueryStats()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        yield stats
+
+
+def view_query_budget(view_func):
+    """Бюджет запросов, объявленный у класса представления."""
+    view_class = getattr(view_func, "view_class", None)
+    return getattr(view_class, "query_budget", None)
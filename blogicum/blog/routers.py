@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+PRIMARY_COOKIE = "blog_primary"
+
+_replica_reads = ContextVar("blog_replica_reads", default=False)
+
+
+def replica_alias():
+    """Псевдоним реплики из REPLICA_DATABASE или None."""
+    return getattr(settings, "REPLICA_DATABASE", None)
+
+
+@contextmanager
+def read_from_replica():
+    """Внутри блока чтение идёт с реплики, если она настроена."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def read_from_primary():
+    """Внутри блока чтение идёт с основной базы, даже в read_from_replica."""
+    token = _replica_reads.set(False)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def is_pinned_to_primary(request):
+    """После записи пользователь какое-то время читает с основной базы."""
+    return PRIMARY_COOKIE in request.COOKIES
+
+
+class PrimaryReplicaRouter:
+    """Запись — в основную базу, чтение страниц блога — с реплики."""
+
+    def db_for_read(self, model, **hints):
+        alias = replica_alias()
+        if alias and _replica_reads.get():
+            return alias
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == replica_alias():
+            return False
+        return None
+
+
+class ReplicaReadMixin:
+    """
+    Отдаёт страницу, читая данные с реплики.
+    Страницы, которые попадут в общий кэш, AnonymousPageCacheMixin
+    читает с основной базы.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if (
+            request.method not in ("GET", "HEAD")
+            or is_pinned_to_primary(request)
+        ):
+            return super().dispatch(request, *args, **kwargs)
+        with read_from_replica():
+            response = super().dispatch(request, *args, **kwargs)
+            if hasattr(response, "render"):
+                response.render()
+        return response
@@ -0,0 +1,89 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from blog.cache import (
+    invalidate_categories,
+    invalidate_pages,
+    invalidate_post_cards,
+)
+from blog.jobs import enqueue_image_job
+from blog.models import Category, Comment, DeletionCounter, Location, Post
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def reset_post_cards(sender, **kwargs):
+    """Карточки зависят от публикации, её категории и местоположения."""
+    invalidate_post_cards()
+    invalidate_pages()
+
+
+@receiver(post_delete, sender=Post)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Location)
+@receiver(post_delete, sender=Comment)
+def count_deletion(sender, **kwargs):
+    """Удаление не меняет updated_at: ETag страниц видит его по счётчику."""
+    DeletionCounter.increment()
+
+
+@receiver(pre_save, sender=User)
+def remember_username(sender, instance, update_fields=None, **kwargs):
+    """Запоминает прежнее имя, чтобы после сохранения сравнить его."""
+    if instance.pk is None or (
+        update_fields is not None and "username" not in update_fields
+    ):
+        instance._previous_username = instance.username
+        return
+    instance._previous_username = (
+        User.objects.filter(pk=instance.pk)
+        .values_list("username", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=User)
+def reset_post_cards_on_user_change(sender, instance, created=False, **kwargs):
+    """
+    Из данных пользователя карточки и комментарии выводят только
+    имя. Смена пароля, почты или входа в систему их не меняет.
+    """
+    previous = getattr(instance, "_previous_username", None)
+    if created or previous == instance.username:
+        return
+    # ETag страниц строится по updated_at публикаций и комментариев.
+    now = timezone.now()
+    Post.objects.filter(author=instance).update(updated_at=now)
+    Comment.objects.filter(author=instance).update(updated_at=now)
+    invalidate_post_cards()
+    invalidate_pages()
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def reset_pages(sender, **kwargs):
+    """Лента выводит количество комментариев под каждой публикацией."""
+    invalidate_pages()
+
+
+@receiver(post_save, sender=Post)
+def queue_image_processing(sender, instance, **kwargs):
+    """Отправляет новое фото на обработку в фоне."""
+    if not instance.image or instance.has_renditions:
+        return
+    enqueue_image_job(instance)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def reset_categories(sender, **kwargs):
+    """Slug и видимость категории могли измениться."""
+    invalidate_categories()
@@ -0,0 +1,70 @@
+import gzip
+import posixpath
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".css", ".js", ".map", ".svg", ".txt", ".html", ".json", ".xml", ".ico",
+)
+MIN_COMPRESS_SIZE = 256
+
+
+def compressors():
+    """Доступные алгоритмы сжатия: расширение и функция."""
+    available = [(".gz", lambda data: gzip.compress(data, 9, mtime=0))]
+    if brotli is not None:
+        available.insert(0, (".br", lambda data: brotli.compress(data)))
+    return available
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Статика с хэшем содержимого в имени файла.
+    Рядом с текстовыми файлами при collectstatic кладутся
+    сжатые копии .gz и, если установлен brotli, .br.
+    Ссылки на source map не переписываются: карты в сборку
+    не входят, и collectstatic падал бы на bootstrap.min.css.
+    """
+
+    keep_intermediate_files = False
+    patterns = tuple(
+        (extension, tuple(
+            pattern for pattern in rules
+            if "sourceMappingURL" not in str(pattern)
+        ))
+        for extension, rules in ManifestStaticFilesStorage.patterns
+    )
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        for name in self.hashed_files.values():
+            for compressed in self.compress(name):
+                yield name, compressed, True
+
+    def compress(self, name):
+        if posixpath.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+            return
+        with self.open(name) as original:
+            data = original.read()
+        if len(data) < MIN_COMPRESS_SIZE:
+            return
+        for extension, compress in compressors():
+            compressed = compress(data)
+            if len(compressed) >= len(data):
+                continue
+            target = name + extension
+            if self.exists(target):
+                self.delete(target)
+            yield self._save(target, ContentFile(compressed))
+
+    def immutable_names(self):
+        """Имена файлов с хэшем: их можно кэшировать навсегда."""
+        return frozenset(self.hashed_files.values())
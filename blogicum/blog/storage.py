@@ -0,0 +1,43 @@
+import hashlib
+import posixpath
+
+from django.core.files.storage import FileSystemStorage, storages
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Хранит файлы под именем, равным SHA-256 содержимого,
+    в подкаталогах по первым символам хэша.
+    Одинаковые загрузки сохраняются на диск один раз.
+    """
+
+    hash_name = "sha256"
+    shard_depth = 2
+    shard_width = 2
+
+    def content_hash(self, content):
+        """Хэш считается по частям, файл целиком в память не читается."""
+        digest = hashlib.new(self.hash_name)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def hashed_name(self, name, content):
+        directory, filename = posixpath.split(name)
+        extension = posixpath.splitext(filename)[1].lower()
+        digest = self.content_hash(content)
+        shards = [
+            digest[i * self.shard_width:(i + 1) * self.shard_width]
+            for i in range(self.shard_depth)
+        ]
+        return posixpath.join(directory, *shards, digest + extension)
+
+    def _save(self, name, content):
+        name = self.hashed_name(name, content)
+        if self.exists(name):
+            return name
+        return super()._save(name, content)
+
+
+def post_image_storage():
+    return storages["post_images"]
@@ -0,0 +1,38 @@
+import time
+
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates, Template, reraise
+
+from blog.metrics import registry
+
+
+class InstrumentedTemplate(Template):
+    """Шаблон, время отрисовки которого попадает в метрики."""
+
+    def render(self, context=None, request=None):
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            registry.observe(
+                "blog_template_render_seconds",
+                {"template": self.template.name or "<string>"},
+                time.perf_counter() - started,
+            )
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """Стандартный движок шаблонов Django с замером отрисовки."""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(
+            self.engine.from_string(template_code), self
+        )
+
+    def get_template(self, template_name):
+        try:
+            return InstrumentedTemplate(
+                self.engine.get_template(template_name), self
+            )
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
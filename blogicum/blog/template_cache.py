@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.template.utils import get_app_template_dirs
+
+
+def template_names(engine, app_dirs=False):
+    """Имена всех шаблонов из каталогов движка."""
+    directories = list(engine.dirs)
+    if app_dirs:
+        directories += get_app_template_dirs("templates")
+    names = set()
+    for directory in map(Path, directories):
+        for path in directory.rglob("*.html"):
+            names.add(path.relative_to(directory).as_posix())
+    return sorted(names)
+
+
+def warm_templates(app_dirs=False):
+    """
+    Компилирует шаблоны заранее.
+    С кэширующим загрузчиком первый запрос воркера
+    получает уже разобранные шаблоны.
+    """
+    warmed = 0
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for name in template_names(backend.engine, app_dirs):
+            backend.engine.get_template(name)
+            warmed += 1
+    return warmed
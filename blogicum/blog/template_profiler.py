@@ -0,0 +1,91 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.template.base import Template
+
+_active_profile = ContextVar("template_profile", default=None)
+_original_render = None
+
+
+class TemplateProfile:
+    """
+    Время отрисовки шаблонов: полное и собственное (без вложенных
+    шаблонов) по имени шаблона, по паре «шаблон → include»
+    и по стекам вызовов для флейм-графа.
+    """
+
+    def __init__(self):
+        self.frames = []
+        self.calls = defaultdict(int)
+        self.cumulative = defaultdict(float)
+        self.own = defaultdict(float)
+        self.includes = defaultdict(float)
+        self.stacks = defaultdict(float)
+
+    def enter(self, name):
+        path = f"{self.frames[-1]['path']};{name}" if self.frames else name
+        self.frames.append({
+            "name": name,
+            "path": path,
+            "started": time.perf_counter(),
+            "children": 0.0,
+        })
+
+    def exit(self):
+        frame = self.frames.pop()
+        elapsed = time.perf_counter() - frame["started"]
+        own = elapsed - frame["children"]
+        name = frame["name"]
+        self.calls[name] += 1
+        self.cumulative[name] += elapsed
+        self.own[name] += own
+        self.stacks[frame["path"]] += own
+        if self.frames:
+            parent = self.frames[-1]
+            parent["children"] += elapsed
+            self.includes[parent["name"], name] += elapsed
+
+    def collapsed(self):
+        """Стеки в формате flamegraph.pl/speedscope, время в мкс."""
+        return "".join(
+            f"{path} {round(seconds * 1_000_000)}\n"
+            for path, seconds in sorted(self.stacks.items())
+        )
+
+
+def _profiled_render(self, context):
+    profile = _active_profile.get()
+    if profile is None:
+        return _original_render(self, context)
+    profile.enter(self.name or "<string>")
+    try:
+        return _original_render(self, context)
+    finally:
+        profile.exit()
+
+
+def install():
+    """
+    Подменяет Template._render при первом профилировании.
+    До этого шаблоны отрисовываются без обёртки, после —
+    с одной проверкой ContextVar вне профилирования.
+    """
+    global _original_render
+    if Template._render is _profiled_render:
+        return
+    _original_render = Template._render
+    Template._render = _profiled_render
+
+
+@contextmanager
+def profile_templates():
+    """Профилирует отрисовку шаблонов внутри блока."""
+    install()
+    profile = TemplateProfile()
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
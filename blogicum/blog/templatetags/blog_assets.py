@@ -0,0 +1,46 @@
+from functools import lru_cache
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from django_bootstrap5.templatetags.django_bootstrap5 import bootstrap_css
+
+register = template.Library()
+
+
+@lru_cache
+def read_critical_css(name):
+    """Содержимое файла критического CSS или пустая строка."""
+    path = finders.find(name)
+    if path is None:
+        return ""
+    with open(path, encoding="utf-8") as stylesheet:
+        return stylesheet.read().strip().replace("</", "<\\/")
+
+
+@register.simple_tag
+def bootstrap_stylesheet():
+    """
+    Подключает Bootstrap.
+    В режиме local файл берётся из статики проекта, критический CSS
+    встраивается в страницу, а полная таблица загружается без
+    блокировки отрисовки.
+    """
+    if settings.BLOG_BOOTSTRAP_MODE != "local":
+        return bootstrap_css()
+    url = static(settings.BLOG_BOOTSTRAP_CSS)
+    critical = read_critical_css(settings.BLOG_CRITICAL_CSS)
+    if not critical:
+        return format_html('<link rel="stylesheet" href="{}">', url)
+    return format_html(
+        "<style>{}</style>"
+        '<link rel="preload" href="{}" as="style" '
+        "onload=\"this.onload=null;this.rel='stylesheet'\">"
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        mark_safe(critical),
+        url,
+        url,
+    )
@@ -0,0 +1,19 @@
+from django import template
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from blog.models import SNIPPET_END, SNIPPET_START
+
+register = template.Library()
+
+
+@register.filter
+def highlight(snippet):
+    """Выделяет найденные слова во фрагменте текста."""
+    if not snippet:
+        return ""
+    return mark_safe(
+        escape(snippet)
+        .replace(SNIPPET_START, "<mark>")
+        .replace(SNIPPET_END, "</mark>")
+    )
@@ -20,6 +20,11 @@ post_urls = [
         views.PostDeleteView.as_view(),
         name="delete_post",
     ),
+    path(
+        "<int:post_id>/comments/",
+        views.PostCommentsView.as_view(),
+        name="post_comments",
+    ),
     path(
         "<int:post_id>/comment/",
         views.CommentAddView.as_view(),
@@ -40,6 +45,7 @@ post_urls = [
 
 urlpatterns = [
     path("", views.IndexView.as_view(), name="index"),
+    path("search/", views.SearchView.as_view(), name="search"),
     path('posts/', include(post_urls)),
     path(
         "profile_edit/",
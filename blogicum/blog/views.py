@@ -1,10 +1,14 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db.models import Count
-from django.http import Http404, HttpResponseRedirect
+from django.db import transaction
+from django.db.models import F
+from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
+from django.middleware.csrf import get_token
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare
 from django.urls import reverse_lazy
 from django.views.generic import (
     CreateView,
@@ -12,37 +16,55 @@ from django.views.generic import (
     DetailView,
     ListView,
     UpdateView,
+    View,
 )
 
+from blog.cache import (
+    AnonymousPageCacheMixin,
+    ConditionalGetMixin,
+    get_published_category,
+    latest,
+)
 from blog.forms import PostForm, CommentForm
-from blog.models import Category, Post, Comment
+from blog.metrics import render_metrics
+from blog.models import Category, Comment, Location, Post
+from blog.paginators import (
+    CursorPaginationMixin,
+    CursorPaginator,
+    InvalidCursor,
+)
+from blog.routers import ReplicaReadMixin
 
 NUMBER_OF_OBJECTS_ON_PAGE = 10
+NUMBER_OF_COMMENTS_ON_PAGE = 20
 User = get_user_model()
 
 
 def organize_queryset(filter=False, order=False):
-    """Получает посты с учетом фильтрации и сортировки."""
+    """
+    Получает посты с учетом фильтрации и сортировки.
+    Для лент (order=True) полный текст не загружается:
+    карточке достаточно поля excerpt.
+    """
     queryset = Post.objects.select_related("category", "author", "location")
     if filter:
-        queryset = queryset.filter(
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=timezone.now(),
-        )
+        queryset = queryset.published()
     if order:
-        queryset = queryset.annotate(comment_count=Count("comments")).order_by(
-            "-pub_date"
-        )
+        queryset = queryset.defer("text").order_by("-pub_date")
     return queryset
 
 
 class OnlyAuthorMixin(UserPassesTestMixin):
     """Позволяет удалять и редактировать записи только авторам."""
 
+    def get_object(self, queryset=None):
+        """Объект загружается один раз: для проверки прав и для формы."""
+        if not hasattr(self, "_object"):
+            self._object = super().get_object(queryset)
+        return self._object
+
     def test_func(self):
-        object = self.get_object()
-        return object.author == self.request.user
+        return self.get_object().author_id == self.request.user.id
 
     def handle_no_permission(self):
         return HttpResponseRedirect(
@@ -63,15 +85,32 @@ class UserCreateView(CreateView):
     form_class = UserCreationForm
 
 
-class ProfileView(ListView):
+class ProfileView(
+    ReplicaReadMixin,
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    ListView,
+):
     """Выводит список публикаций."""
 
     model = User
     template_name = "blog/profile.html"
     paginate_by = NUMBER_OF_OBJECTS_ON_PAGE
+    query_budget = 7
 
     def get_user(self):
-        return get_object_or_404(User, username=self.kwargs["username"])
+        if not hasattr(self, "_user"):
+            self._user = get_object_or_404(
+                User, username=self.kwargs["username"]
+            )
+        return self._user
+
+    def get_etag_extra(self):
+        user = self.get_user()
+        return (
+            user.username, user.get_full_name(), user.is_staff,
+            user.date_joined,
+        )
 
     def get_queryset(self):
         user = self.get_user()
@@ -104,12 +143,41 @@ class ProfileEditView(LoginRequiredMixin, UpdateView):
         )
 
 
-class PostDetailView(DetailView):
+class PostDetailView(ReplicaReadMixin, ConditionalGetMixin, DetailView):
     """Отображение поста."""
 
     queryset = organize_queryset()
     template_name = "blog/detail.html"
     pk_url_kwarg = "post_id"
+    query_budget = 6
+
+    def get_validators(self):
+        post_id = self.kwargs[self.pk_url_kwarg]
+        return {
+            "post_updated": latest(
+                Post.objects.filter(pk=post_id), "updated_at"
+            ),
+            "category_updated": latest(
+                Category.objects.filter(posts=post_id), "updated_at"
+            ),
+            "location_updated": latest(
+                Location.objects.filter(posts=post_id), "updated_at"
+            ),
+            "comment_updated": latest(
+                Comment.objects.filter(post=post_id), "updated_at"
+            ),
+        }
+
+    def get_etag_extra(self):
+        # Вошедшему пользователю страница выводит форму комментария
+        # с CSRF-токеном: после смены токена (новый вход в систему)
+        # закэшированная форма уже не пройдёт проверку.
+        if not self.request.user.is_authenticated:
+            return ()
+        # get_token выдаёт секрет, если cookie ещё нет, и каждый раз
+        # маскирует его заново, поэтому в ETag идёт сам секрет.
+        get_token(self.request)
+        return (self.request.META["CSRF_COOKIE"],)
 
     def get_object(self, queryset=None):
         post = super().get_object()
@@ -122,12 +190,39 @@ class PostDetailView(DetailView):
             raise Http404
         return post
 
+    def get_comments_page(self, after=None):
+        paginator = CursorPaginator(
+            Comment.objects.select_related("author").filter(
+                post_id=self.object.id
+            ),
+            NUMBER_OF_COMMENTS_ON_PAGE,
+            date_field="created_at",
+            descending=False,
+        )
+        try:
+            return paginator.page(after=after)
+        except InvalidCursor:
+            raise Http404("Некорректный курсор страницы.")
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["form"] = CommentForm()
-        context["comments"] = Comment.objects.select_related("author").filter(
-            post__id=self.kwargs["post_id"]
-        )
+        context["comments"] = self.get_comments_page()
+        return context
+
+
+class PostCommentsView(PostDetailView):
+    """Следующая порция комментариев к посту (HTML-фрагмент)."""
+
+    template_name = "includes/comments.html"
+
+    def get_context_data(self, **kwargs):
+        context = {
+            "post": self.object,
+            "comments": self.get_comments_page(self.request.GET.get("after")),
+            "comments_fragment": True,
+        }
+        context.update(kwargs)
         return context
 
 
@@ -180,7 +275,13 @@ class CommentAddView(LoginRequiredMixin, CreateView):
     def form_valid(self, form):
         form.instance.author = self.request.user
         form.instance.post = get_object_or_404(Post, id=self.kwargs["post_id"])
-        return super().form_valid(form)
+        with transaction.atomic():
+            response = super().form_valid(form)
+            Post.objects.filter(id=form.instance.post_id).update(
+                comment_count=F("comment_count") + 1,
+                updated_at=timezone.now(),
+            )
+        return response
 
 
 class CommentEditView(LoginRequiredMixin, OnlyAuthorMixin, UpdateView):
@@ -191,12 +292,8 @@ class CommentEditView(LoginRequiredMixin, OnlyAuthorMixin, UpdateView):
     pk_url_kwarg = "comment_id"
     template_name = "blog/create.html"
 
-    def get_object(self):
-        return get_object_or_404(
-            Comment,
-            id=self.kwargs["comment_id"],
-            post__id=self.kwargs["post_id"]
-        )
+    def get_queryset(self):
+        return Comment.objects.filter(post_id=self.kwargs["post_id"])
 
 
 class CommentDeleteView(LoginRequiredMixin, OnlyAuthorMixin, DeleteView):
@@ -206,33 +303,64 @@ class CommentDeleteView(LoginRequiredMixin, OnlyAuthorMixin, DeleteView):
     pk_url_kwarg = "comment_id"
     template_name = "blog/create.html"
 
-    def get_object(self):
-        return get_object_or_404(
-            Comment,
-            id=self.kwargs["comment_id"],
-            post__id=self.kwargs["post_id"]
-        )
-
+    def get_queryset(self):
+        return Comment.objects.filter(post_id=self.kwargs["post_id"])
 
-class IndexView(ListView):
+    def form_valid(self, form):
+        with transaction.atomic():
+            response = super().form_valid(form)
+            Post.objects.filter(
+                id=self.object.post_id, comment_count__gt=0
+            ).update(
+                comment_count=F("comment_count") - 1,
+                updated_at=timezone.now(),
+            )
+        return response
+
+
+class IndexView(
+    ReplicaReadMixin,
+    AnonymousPageCacheMixin,
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    ListView,
+):
     """Выводит список публикаций на главную."""
 
-    queryset = organize_queryset(filter=True, order=True)
     template_name = "blog/index.html"
     paginate_by = NUMBER_OF_OBJECTS_ON_PAGE
+    query_budget = 6
+
+    def get_queryset(self):
+        return organize_queryset(filter=True, order=True)
 
 
-class CategoryView(ListView):
+class CategoryView(
+    ReplicaReadMixin,
+    AnonymousPageCacheMixin,
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    ListView,
+):
     """Выводит на страницу список публикаций по категориям."""
 
     template_name = "blog/category.html"
     model = Post
     paginate_by = NUMBER_OF_OBJECTS_ON_PAGE
+    query_budget = 7
 
     def get_category(self):
-        return get_object_or_404(
-            Category, is_published=True, slug=self.kwargs["category_slug"]
-        )
+        if not hasattr(self, "_category"):
+            self._category = get_published_category(
+                self.kwargs["category_slug"]
+            )
+            if self._category is None:
+                raise Http404("Категория не найдена.")
+        return self._category
+
+    def get_etag_extra(self):
+        category = self.get_category()
+        return (category.pk, category.updated_at)
 
     def get_queryset(self):
         category = self.get_category()
@@ -246,3 +374,53 @@ class CategoryView(ListView):
         context = super().get_context_data(**kwargs)
         context["category"] = self.get_category()
         return context
+
+
+class SearchView(ListView):
+    """Полнотекстовый поиск по опубликованным постам."""
+
+    template_name = "blog/search.html"
+    paginate_by = NUMBER_OF_OBJECTS_ON_PAGE
+    query_budget = 4
+
+    def get_search_query(self):
+        return self.request.GET.get("q", "").strip()
+
+    def get_queryset(self):
+        query = self.get_search_query()
+        if not query:
+            return Post.objects.none()
+        return organize_queryset(filter=True).defer("text").search(query)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["query"] = self.get_search_query()
+        return context
+
+
+class MetricsView(View):
+    """
+    Метрики в текстовом формате Prometheus.
+    Если задан METRICS_TOKEN, нужен заголовок
+    Authorization: Bearer <токен>. Иначе доступ по REMOTE_ADDR
+    из METRICS_ALLOWED_IPS: за обратным прокси на том же хосте
+    все запросы приходят с 127.0.0.1, поэтому там нужен токен.
+    """
+
+    http_method_names = ["get"]
+
+    def has_access(self, request):
+        if settings.METRICS_TOKEN:
+            return constant_time_compare(
+                request.headers.get("Authorization", ""),
+                f"Bearer {settings.METRICS_TOKEN}",
+            )
+        return request.META.get("REMOTE_ADDR") in settings.METRICS_ALLOWED_IPS
+
+    def get(self, request):
+        if not self.has_access(request):
+            raise Http404
+        return HttpResponse(
+            render_metrics(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
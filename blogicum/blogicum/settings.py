@@ -20,19 +20,20 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'blog.apps.BlogConfig',
     'pages.apps.PagesConfig',
-    'debug_toolbar',
     'django_bootstrap5',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'blog.middleware.MetricsMiddleware',
+    'blog.middleware.QueryBudgetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
+    'blog.middleware.ReplicaStickinessMiddleware',
 ]
 
 ROOT_URLCONF = 'blogicum.urls'
@@ -41,7 +42,8 @@ TEMPLATES_DIR = BASE_DIR / 'templates'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'blog.template_backends.InstrumentedDjangoTemplates',
+        'NAME': 'django',
         'DIRS': [TEMPLATES_DIR],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -50,11 +52,26 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'blog.context_processors.post_card_cache',
             ],
         },
     },
 ]
 
+WARM_TEMPLATES_ON_STARTUP = False
+
+QUERY_BUDGET_RAISE = False
+
+SERVER_TIMING = True
+
+METRICS_DIR = None
+
+METRICS_FLUSH_INTERVAL = 5
+
+METRICS_ALLOWED_IPS = ['127.0.0.1']
+
+METRICS_TOKEN = None
+
 WSGI_APPLICATION = 'blogicum.wsgi.application'
 
 DATABASES = {
@@ -64,6 +81,14 @@ DATABASES = {
     }
 }
 
+DATABASE_ROUTERS = ['blog.routers.PrimaryReplicaRouter']
+
+REPLICA_DATABASE = None
+
+REPLICA_STICKY_SECONDS = 10
+
+SQLITE_PRAGMAS = {}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -95,18 +120,52 @@ STATICFILES_DIRS = [
 
 STATIC_URL = '/static/'
 
-DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+BLOG_BOOTSTRAP_MODE = 'cdn'
 
-INTERNAL_IPS = [
-    '127.0.0.1',
-]
+BLOG_BOOTSTRAP_CSS = 'css/bootstrap.min.css'
+
+BLOG_CRITICAL_CSS = 'css/bootstrap.critical.css'
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 CSRF_FAILURE_VIEW = 'pages.views.csrf_failure'
 
 LOGIN_REDIRECT_URL = 'blog:index'
 
+BLOG_PAGINATION_MODE = 'offset'
+
+BLOG_PUBLISHED_CUTOFF_BUCKET = 0
+
+POST_CARD_CACHE_TIMEOUT = 60 * 15
+
+BLOG_PAGE_CACHE_TIMEOUT = 60 * 5
+
+BLOG_CATEGORY_CACHE_TIMEOUT = 60 * 60
+
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 
 MEDIA_ROOT = BASE_DIR / 'media'
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+    'post_images': {
+        'BACKEND': 'blog.storage.ContentAddressedStorage',
+    },
+}
+
+POST_IMAGE_RENDITION_WIDTHS = (320, 640, 1280)
+
+POST_IMAGE_RENDITION_QUALITY = 80
+
+POST_IMAGE_MAX_PIXELS = 40_000_000
+
+IMAGE_JOBS_POLL_INTERVAL = 2
+
+IMAGE_JOBS_RUNNING_TIMEOUT = 600
@@ -0,0 +1,112 @@
+import os
+
+from .settings import *  # noqa: F401,F403
+from .settings import BASE_DIR, MIDDLEWARE, STORAGES, TEMPLATES
+
+
+def env_list(name, default=''):
+    return [item for item in os.environ.get(name, default).split(',') if item]
+
+
+SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+
+DEBUG = False
+
+ALLOWED_HOSTS = env_list('DJANGO_ALLOWED_HOSTS', 'localhost,127.0.0.1')
+
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        'APP_DIRS': False,
+        'OPTIONS': {
+            **TEMPLATES[0]['OPTIONS'],
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+        },
+    },
+]
+
+MIDDLEWARE = [
+    MIDDLEWARE[0],
+    'blog.middleware.StaticFilesMiddleware',
+    *MIDDLEWARE[1:],
+]
+
+SERVER_TIMING = os.environ.get('DJANGO_SERVER_TIMING') == '1'
+
+METRICS_DIR = os.environ.get('DJANGO_METRICS_DIR')
+
+# За обратным прокси все запросы приходят с 127.0.0.1, поэтому
+# /metrics закрыт, пока не задан токен или явный список IP
+# для прямого опроса в обход прокси.
+METRICS_ALLOWED_IPS = env_list('DJANGO_METRICS_ALLOWED_IPS')
+
+METRICS_TOKEN = os.environ.get('DJANGO_METRICS_TOKEN')
+
+STATIC_ROOT = os.environ.get('DJANGO_STATIC_ROOT', BASE_DIR / 'static')
+
+BLOG_BOOTSTRAP_MODE = os.environ.get('DJANGO_BOOTSTRAP_MODE', 'local')
+
+STORAGES = {
+    **STORAGES,
+    'staticfiles': {
+        'BACKEND': 'blog.staticfiles.CompressedManifestStaticFilesStorage',
+    },
+}
+
+WARM_TEMPLATES_ON_STARTUP = (
+    os.environ.get('DJANGO_WARM_TEMPLATES', '1') == '1'
+)
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('DJANGO_DB_PATH', BASE_DIR / 'db.sqlite3'),
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'timeout': int(os.environ.get('DJANGO_DB_TIMEOUT', 20)),
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+}
+
+if os.environ.get('DJANGO_REPLICA_DB_PATH'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.environ['DJANGO_REPLICA_DB_PATH'],
+    }
+    REPLICA_DATABASE = 'replica'
+
+# Сброс кэша страниц, карточек и категорий работает через счётчики
+# поколений в кэше, поэтому кэш должен быть общим для всех воркеров
+# и process_image_jobs (см. проверку blog.W001).
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'DJANGO_CACHE_BACKEND',
+            'django.core.cache.backends.filebased.FileBasedCache',
+        ),
+        'LOCATION': os.environ.get(
+            'DJANGO_CACHE_LOCATION', str(BASE_DIR / 'cache')
+        ),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(
+                os.environ.get('DJANGO_CACHE_MAX_ENTRIES', 10000)
+            ),
+        },
+    }
+}
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': int(os.environ.get('DJANGO_DB_BUSY_TIMEOUT_MS', 20000)),
+    'cache_size': int(os.environ.get('DJANGO_DB_CACHE_SIZE', -64000)),
+    'mmap_size': int(os.environ.get('DJANGO_DB_MMAP_SIZE', 268435456)),
+    'temp_store': 'MEMORY',
+}
@@ -3,7 +3,7 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
-from blog.views import UserCreateView
+from blog.views import MetricsView, UserCreateView
 
 handler404 = "pages.views.page_not_found"
 handler500 = "pages.views.server_error"
@@ -14,7 +14,8 @@ urlpatterns = [
     path("auth/", include("django.contrib.auth.urls")),
     path("auth/registration/", UserCreateView.as_view(), name="registration"),
     path("pages/", include("pages.urls")),
+    path("metrics", MetricsView.as_view(), name="metrics"),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-if settings.DEBUG:
+if "debug_toolbar" in settings.INSTALLED_APPS:
     import debug_toolbar
     urlpatterns += (path("__debug__/", include(debug_toolbar.urls)),)
@@ -24,6 +24,7 @@ from django.forms import BaseForm
 from django.http import HttpResponse
 from django.test import override_settings
 from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
 from mixer.backend.django import mixer as _mixer
 
 N_PER_FIXTURE = 3
@@ -92,6 +93,8 @@ pytest_plugins = [
     "fixtures.locations",
     "fixtures.categories",
     "fixtures.comments",
+    "fixtures.queries",
+    "fixtures.caches",
     "adapters.comment",
 ]
 
@@ -334,6 +337,15 @@ def restore_cleaned_data(cleaned_data: dict) -> dict:
     return cleaned_data_fixed
 
 
+def count_table_queries(context: CaptureQueriesContext, table: str) -> int:
+    """Queries that read the table itself, not in a subquery (alias U0)."""
+    pattern = re.compile(rf'FROM "{table}"(?! U\d)')
+    return sum(
+        bool(pattern.search(query["sql"]))
+        for query in context.captured_queries
+    )
+
+
 def squash_code(code: str) -> str:
     result = re.sub(r"#.+", "", code)
     result = result.replace("\n", "").replace(" ", "")
@@ -363,6 +375,7 @@ def cleanup(request):
                     filename.endswith(".jpg")
                     or filename.endswith(".gif")
                     or filename.endswith(".png")
+                    or filename.endswith(".webp")
             ):
                 file_path = os.path.join(root, filename)
                 if os.path.getmtime(file_path) >= start_time:
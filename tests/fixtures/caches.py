@@ -0,0 +1,15 @@
+import pytest
+from django.test import override_settings
+
+
+@pytest.fixture
+def file_cache(tmp_path):
+    """Общий для процессов кэш, как в настройках для продакшена."""
+    caches = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path),
+        }
+    }
+    with override_settings(CACHES=caches):
+        yield tmp_path
@@ -0,0 +1,9 @@
+import pytest
+from django.test import override_settings
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budgets():
+    """Превышение query_budget у представления валит тест."""
+    with override_settings(QUERY_BUDGET_RAISE=True):
+        yield
@@ -0,0 +1,48 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from conftest import count_table_queries
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("action", ["edit", "delete"])
+def test_post_author_views_fetch_post_once(
+        user_client: Client, post_with_published_location, action
+):
+    url = f"/posts/{post_with_published_location.id}/{action}/"
+    with CaptureQueriesContext(connection) as context:
+        response = user_client.get(url)
+    assert response.status_code == 200
+    assert count_table_queries(context, "blog_post") == 1, (
+        "Убедитесь, что публикация загружается из базы один раз."
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("action", ["edit_comment", "delete_comment"])
+def test_comment_author_views_fetch_comment_once(
+        another_user_client: Client, another_user, comment_to_a_post, action
+):
+    comment_to_a_post.author = another_user
+    comment_to_a_post.save()
+    url = (
+        f"/posts/{comment_to_a_post.post_id}/{action}/{comment_to_a_post.id}/"
+    )
+    with CaptureQueriesContext(connection) as context:
+        response = another_user_client.get(url)
+    assert response.status_code == 200
+    assert count_table_queries(context, "blog_comment") == 1, (
+        "Убедитесь, что комментарий загружается из базы один раз."
+    )
+
+
+@pytest.mark.django_db
+def test_not_author_is_redirected(
+        another_user_client: Client, post_with_published_location
+):
+    post_id = post_with_published_location.id
+    response = another_user_client.get(f"/posts/{post_id}/edit/")
+    assert response.status_code == 302
+    assert response.url == f"/posts/{post_id}/"
@@ -0,0 +1,44 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Model
+from django.test import Client
+
+from blog.models import Comment, Post
+
+
+@pytest.mark.django_db
+def test_comment_count_follows_views(
+        user_client: Client, post_with_published_location: Model
+):
+    post_url = f"/posts/{post_with_published_location.id}/"
+    for _ in range(2):
+        user_client.post(f"{post_url}comment/", data={"text": "Текст"})
+    post_with_published_location.refresh_from_db()
+    assert post_with_published_location.comment_count == 2, (
+        "Убедитесь, что при добавлении комментария увеличивается счётчик"
+        " `comment_count` публикации."
+    )
+
+    comment = Comment.objects.filter(
+        post=post_with_published_location).first()
+    user_client.post(f"{post_url}delete_comment/{comment.id}/")
+    post_with_published_location.refresh_from_db()
+    assert post_with_published_location.comment_count == 1, (
+        "Убедитесь, что при удалении комментария уменьшается счётчик"
+        " `comment_count` публикации."
+    )
+
+
+@pytest.mark.django_db
+def test_recount_comments_command(
+        post_with_published_location: Model, comment_to_a_post: Model
+):
+    Post.objects.update(comment_count=42)
+    call_command("recount_comments", stdout=StringIO())
+    post = Post.objects.get(pk=comment_to_a_post.post_id)
+    assert post.comment_count == Comment.objects.filter(post=post).count(), (
+        "Убедитесь, что команда `recount_comments` пересчитывает"
+        " количество комментариев публикаций."
+    )
@@ -0,0 +1,51 @@
+import re
+
+import pytest
+from django.test import Client
+
+from blog.models import Comment, Post
+from blog.views import NUMBER_OF_COMMENTS_ON_PAGE
+
+
+@pytest.mark.django_db
+def test_comments_are_loaded_in_pages(
+        mixer, client: Client, post_with_published_location
+):
+    post = post_with_published_location
+    total = NUMBER_OF_COMMENTS_ON_PAGE + 5
+    mixer.cycle(total).blend("blog.Comment", post=post)
+
+    response = client.get(f"/posts/{post.id}/")
+    shown = [comment.id for comment in response.context["comments"]]
+    assert len(shown) == NUMBER_OF_COMMENTS_ON_PAGE, (
+        "Убедитесь, что на странице поста выводится ограниченное число"
+        " комментариев."
+    )
+    more_url = re.search(
+        r'href="([^"]+)" data-load-comments',
+        response.content.decode("utf-8"),
+    ).group(1)
+
+    fragment = client.get(more_url)
+    assert fragment.status_code == 200
+    assert "<html" not in fragment.content.decode("utf-8")
+    shown += [comment.id for comment in fragment.context["comments"]]
+    assert shown == list(
+        Comment.objects.filter(post=post)
+        .order_by("created_at", "id")
+        .values_list("id", flat=True)
+    )
+    assert not fragment.context["comments"].has_next()
+
+
+@pytest.mark.django_db
+def test_comment_fragment_hides_unpublished_post(
+        another_user_client: Client, post_with_published_location
+):
+    Post.objects.filter(pk=post_with_published_location.pk).update(
+        is_published=False
+    )
+    response = another_user_client.get(
+        f"/posts/{post_with_published_location.id}/comments/"
+    )
+    assert response.status_code == 404
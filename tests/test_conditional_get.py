@@ -0,0 +1,143 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.utils import timezone
+
+from blog.cache import feed_validators
+from blog.models import Comment, DeletionCounter, Post
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_template",
+    [
+        "/",
+        "/posts/{post.id}/",
+        "/category/{post.category.slug}/",
+        "/profile/{post.author.username}/",
+    ],
+    ids=["index", "detail", "category", "profile"],
+)
+def test_unchanged_page_returns_304(
+        user_client: Client, post_with_published_location, url_template
+):
+    url = url_template.format(post=post_with_published_location)
+    response = user_client.get(url)
+    etag = response.headers.get("ETag")
+    assert response.status_code == 200 and etag, (
+        "Убедитесь, что страницы блога отдают заголовок ETag."
+    )
+    repeated = user_client.get(url, headers={"if-none-match": etag})
+    assert repeated.status_code == 304
+
+    post_with_published_location.title = "Изменённый заголовок"
+    post_with_published_location.save()
+    changed = user_client.get(url, headers={"if-none-match": etag})
+    assert changed.status_code == 200
+
+
+@pytest.mark.django_db
+def test_etag_depends_on_user(
+        user_client: Client, another_user_client: Client,
+        post_with_published_location
+):
+    etag = user_client.get("/").headers["ETag"]
+    response = another_user_client.get("/", headers={"if-none-match": etag})
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_etag_follows_database_not_process_cache(
+        user_client: Client, post_with_published_location, mixer
+):
+    post = post_with_published_location
+    etag = user_client.get("/").headers["ETag"]
+
+    # Изменение из другого воркера: сигналы этого процесса не срабатывают.
+    Post.objects.filter(pk=post.pk).update(updated_at=timezone.now())
+    changed = user_client.get("/", headers={"if-none-match": etag})
+    assert changed.status_code == 200, (
+        "Убедитесь, что ETag вычисляется по данным в базе, а не по "
+        "счётчикам в памяти процесса."
+    )
+
+    extra = mixer.blend(
+        "blog.Post",
+        author=post.author,
+        category=post.category,
+        is_published=True,
+    )
+    etag = user_client.get("/").headers["ETag"]
+    Post.objects.filter(pk=extra.pk).delete()
+    assert user_client.get(
+        "/", headers={"if-none-match": etag}
+    ).status_code == 200, "Убедитесь, что удаление публикации меняет ETag."
+
+
+@pytest.mark.django_db
+def test_comment_edit_changes_post_etag(
+        user_client: Client, comment_to_a_post
+):
+    url = f"/posts/{comment_to_a_post.post_id}/"
+    etag = user_client.get(url).headers["ETag"]
+    Comment.objects.filter(pk=comment_to_a_post.pk).update(
+        text="Другой текст", updated_at=timezone.now()
+    )
+    assert user_client.get(
+        url, headers={"if-none-match": etag}
+    ).status_code == 200
+
+
+@pytest.mark.django_db
+def test_post_etag_changes_with_csrf_token(
+        user_client: Client, post_with_published_location
+):
+    url = f"/posts/{post_with_published_location.id}/"
+    user_client.get(url)
+    etag = user_client.get(url).headers["ETag"]
+    assert user_client.get(
+        url, headers={"if-none-match": etag}
+    ).status_code == 304
+
+    # При входе в систему Django выдаёт новый CSRF-токен.
+    user_client.cookies["csrftoken"] = "a" * 32
+    assert user_client.get(
+        url, headers={"if-none-match": etag}
+    ).status_code == 200, (
+        "Убедитесь, что после смены CSRF-токена страница публикации "
+        "отдаётся заново: иначе форма комментария не отправится."
+    )
+
+
+@pytest.mark.django_db
+def test_cached_anonymous_page_answers_304_without_queries(
+        client: Client, post_with_published_location,
+        django_assert_num_queries
+):
+    etag = client.get("/").headers["ETag"]
+    with django_assert_num_queries(0):
+        response = client.get("/", headers={"if-none-match": etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_feed_validators_read_indexes_only(
+        many_posts_with_published_locations
+):
+    query = DeletionCounter.objects.filter(
+        pk=DeletionCounter.ROW_ID
+    ).values("value", **feed_validators())
+    sql, params = query.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        plan = [row[-1] for row in cursor.fetchall()]
+    for step in plan:
+        assert "TEMP B-TREE" not in step, (
+            "Убедитесь, что ETag ленты не сортирует и не считает "
+            f"записи таблиц целиком: {step}"
+        )
+        if step.startswith("SCAN"):
+            assert "INDEX" in step, (
+                "Убедитесь, что ETag ленты читает последние значения "
+                f"по индексам: {step}"
+            )
@@ -0,0 +1,43 @@
+import pytest
+from django.test import Client, override_settings
+
+from blog.critical_css import Vocabulary, extract_critical_css
+
+
+def test_extract_critical_css_keeps_used_rules():
+    vocabulary = Vocabulary(
+        ['<nav class="navbar {% if x %}active{% endif %}">']
+    )
+    css = (
+        "/*! banner */:root{--c:red}.navbar{display:flex}"
+        ".navbar .active,.modal{color:red}.modal{display:none}"
+        "@media (min-width:576px){.modal{width:1px}.navbar{gap:1px}}"
+        "@keyframes spin{to{transform:rotate(1turn)}}table{border:0}"
+    )
+    assert extract_critical_css(css, vocabulary) == (
+        ":root{--c:red}.navbar{display:flex}.navbar .active{color:red}"
+        "@media (min-width:576px){.navbar{gap:1px}}"
+    )
+
+
+@pytest.mark.django_db
+def test_bootstrap_served_from_cdn_by_default(client: Client):
+    content = client.get("/pages/about/").content.decode("utf-8")
+    assert "cdn.jsdelivr.net" in content
+
+
+@pytest.mark.django_db
+@override_settings(BLOG_BOOTSTRAP_MODE="local")
+def test_local_bootstrap_with_inlined_critical_css(client: Client):
+    content = client.get("/pages/about/").content.decode("utf-8")
+    assert "cdn.jsdelivr.net" not in content, (
+        "Убедитесь, что в локальном режиме Bootstrap не грузится с CDN."
+    )
+    assert "<style>:root{" in content, (
+        "Убедитесь, что критический CSS встраивается в <head>."
+    )
+    assert (
+        '<link rel="preload" href="/static/css/bootstrap.min.css" as="style"'
+        in content
+    )
+    assert content.index("<style>") < content.index("</head>")
@@ -0,0 +1,68 @@
+import pytest
+from django.test import Client, override_settings
+
+from blog.models import Post
+from blog.paginators import encode_cursor
+from conftest import N_PER_PAGE
+
+
+@pytest.mark.django_db
+@override_settings(BLOG_PAGINATION_MODE="cursor")
+def test_cursor_pagination_walks_all_posts(
+        user, user_client: Client, many_posts_with_published_locations
+):
+    url = f"/profile/{user.username}/"
+    expected = list(
+        Post.objects.filter(author=user)
+        .order_by("-pub_date", "-id")
+        .values_list("id", flat=True)
+    )
+
+    seen, pages = [], []
+    query = ""
+    while True:
+        response = user_client.get(url + query)
+        page = response.context["page_obj"]
+        assert len(page) <= N_PER_PAGE
+        seen.extend(post.id for post in page)
+        pages.append(page)
+        if not page.has_next():
+            break
+        query = f"?after={page.next_cursor}"
+    assert seen == expected, (
+        "Убедитесь, что курсорная пагинация выводит все публикации"
+        " по порядку и без повторов."
+    )
+
+    response = user_client.get(f"{url}?before={pages[-1].previous_cursor}")
+    assert [post.id for post in response.context["page_obj"]] == [
+        post.id for post in pages[-2]
+    ]
+    assert "?page=" not in response.content.decode("utf-8")
+
+
+@pytest.mark.django_db
+@override_settings(BLOG_PAGINATION_MODE="cursor")
+def test_cursor_pagination_rejects_broken_token(user_client: Client):
+    assert user_client.get("/?after=not-a-cursor").status_code == 404
+
+
+@pytest.mark.django_db
+@override_settings(BLOG_PAGINATION_MODE="cursor")
+def test_cursor_beyond_the_feed_gives_empty_page(
+        user_client: Client, many_posts_with_published_locations
+):
+    posts = Post.objects.order_by("-pub_date", "-id")
+    oldest, newest = posts.last(), posts.first()
+    for query in (
+        f"after={encode_cursor(oldest.pub_date, oldest.id)}",
+        f"before={encode_cursor(newest.pub_date, newest.id)}",
+    ):
+        response = user_client.get(f"/?{query}")
+        assert response.status_code == 200, (
+            "Убедитесь, что курсор за пределами ленты (устаревшая ссылка)"
+            " не приводит к ошибке сервера."
+        )
+        page = response.context["page_obj"]
+        assert len(page) == 0
+        assert not page.has_next() and not page.has_previous()
@@ -0,0 +1,33 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Post
+
+
+@pytest.mark.django_db
+def test_feed_does_not_load_post_text(
+        user, user_client: Client, many_posts_with_published_locations
+):
+    with CaptureQueriesContext(connection) as context:
+        response = user_client.get(f"/profile/{user.username}/")
+    assert response.status_code == 200
+    assert not any(
+        '"blog_post"."text"' in query["sql"]
+        for query in context.captured_queries
+    ), "Убедитесь, что лента не загружает полный текст публикаций."
+    content = response.content.decode("utf-8")
+    for post in response.context["page_obj"]:
+        assert post.excerpt in content
+
+
+@pytest.mark.django_db
+def test_fill_excerpts_command(post_with_published_location):
+    Post.objects.update(excerpt="")
+    call_command("fill_excerpts", stdout=StringIO())
+    post_with_published_location.refresh_from_db()
+    assert post_with_published_location.excerpt
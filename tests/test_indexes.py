@@ -0,0 +1,44 @@
+import pytest
+from django.db import connection
+
+from blog.models import Comment
+from blog.views import organize_queryset
+
+
+@pytest.mark.skipif(
+    connection.vendor != "sqlite", reason="EXPLAIN QUERY PLAN — SQLite"
+)
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("queryset_getter", "index_name"),
+    [
+        (
+            lambda user, category: organize_queryset(filter=True, order=True),
+            "post_published_feed_idx",
+        ),
+        (
+            lambda user, category: organize_queryset(
+                filter=True, order=True).filter(category=category),
+            "post_category_feed_idx",
+        ),
+        (
+            lambda user, category: organize_queryset(
+                order=True).filter(author=user),
+            "post_author_feed_idx",
+        ),
+        (
+            lambda user, category: Comment.objects.select_related(
+                "author").filter(post__id=1),
+            "comment_post_created_idx",
+        ),
+    ],
+    ids=["index", "category", "profile", "comments"],
+)
+def test_feed_queries_use_indexes(
+        user, published_category, queryset_getter, index_name
+):
+    plan = queryset_getter(user, published_category).explain()
+    assert index_name in plan, (
+        f"Убедитесь, что запрос использует индекс `{index_name}`:\n{plan}"
+    )
+    assert "SCAN blog_post" not in plan
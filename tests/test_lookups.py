@@ -0,0 +1,62 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Category
+from conftest import count_table_queries
+
+
+@pytest.mark.django_db
+def test_category_is_fetched_once_and_cached(
+        user_client: Client, post_with_published_location, file_cache
+):
+    url = f"/category/{post_with_published_location.category.slug}/"
+    with CaptureQueriesContext(connection) as context:
+        assert user_client.get(url).status_code == 200
+    assert count_table_queries(context, "blog_category") <= 1
+    with CaptureQueriesContext(connection) as context:
+        assert user_client.get(url).status_code == 200
+    assert count_table_queries(context, "blog_category") == 0, (
+        "Убедитесь, что категория берётся из кэша."
+    )
+
+
+@pytest.mark.django_db
+def test_unpublished_category_cache_is_reset(
+        user_client: Client, post_with_published_location, file_cache
+):
+    category = post_with_published_location.category
+    url = f"/category/{category.slug}/"
+    assert user_client.get(url).status_code == 200
+    category.is_published = False
+    category.save()
+    assert user_client.get(url).status_code == 404
+
+
+@pytest.mark.django_db
+def test_category_is_not_cached_in_process_memory(
+        user_client: Client, post_with_published_location
+):
+    category = post_with_published_location.category
+    url = f"/category/{category.slug}/"
+    assert user_client.get(url).status_code == 200
+    Category.objects.filter(pk=category.pk).update(is_published=False)
+    assert user_client.get(url).status_code == 404, (
+        "Убедитесь, что без общего кэша категория не кэшируется "
+        "между запросами: снятие с публикации в другом процессе "
+        "должно действовать сразу."
+    )
+
+
+@pytest.mark.django_db
+def test_profile_user_is_fetched_once(user, user_client: Client):
+    with CaptureQueriesContext(connection) as context:
+        assert user_client.get(f"/profile/{user.username}/").status_code == 200
+    user_queries = [
+        query["sql"] for query in context.captured_queries
+        if 'WHERE "auth_user"."username"' in query["sql"]
+    ]
+    assert len(user_queries) == 1, (
+        "Убедитесь, что пользователь профиля загружается один раз."
+    )
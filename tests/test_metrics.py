@@ -0,0 +1,80 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import Client, override_settings
+
+from blog.metrics import registry
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint(client: Client, post_with_published_location):
+    client.get("/")
+    client.get("/")
+    client.get(f"/posts/{post_with_published_location.id}/")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    content = response.content.decode("utf-8")
+    for line in (
+        "# TYPE blog_request_duration_seconds histogram",
+        'blog_request_duration_seconds_count{method="GET",view="blog:index"}',
+        'blog_db_queries_count{method="GET",view="blog:post_detail"}',
+        'blog_template_render_seconds_count{template="blog/detail.html"}',
+        'blog_cache_requests_total{cache="page",result="hit"}',
+    ):
+        assert line in content, (
+            f"Убедитесь, что на странице /metrics есть `{line}`."
+        )
+
+
+@pytest.mark.django_db
+def test_metrics_aggregate_worker_files(client: Client, tmp_path):
+    other_worker = {
+        "counters": [
+            ["blog_cache_requests_total", 'cache="page",result="miss"', 1000]
+        ],
+        "histograms": [],
+    }
+    (tmp_path / "999999-1.json").write_text(json.dumps(other_worker))
+    with override_settings(METRICS_DIR=tmp_path):
+        registry.flush(force=True)
+        content = client.get("/metrics").content.decode("utf-8")
+    own = dict(registry.counters).get(
+        ("blog_cache_requests_total", 'cache="page",result="miss"'), 0
+    )
+    assert (
+        'blog_cache_requests_total{cache="page",result="miss"} '
+        f"{own + 1000}"
+    ) in content, "Убедитесь, что метрики всех воркеров суммируются."
+
+
+def test_metrics_hidden_from_other_hosts(client: Client):
+    response = client.get("/metrics", REMOTE_ADDR="10.0.0.1")
+    assert response.status_code == 404
+
+
+@override_settings(METRICS_TOKEN="secret")
+def test_metrics_require_token_when_configured(client: Client):
+    assert client.get("/metrics").status_code == 404, (
+        "Убедитесь, что при заданном METRICS_TOKEN адрес 127.0.0.1 "
+        "не даёт доступа к /metrics."
+    )
+    response = client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret")
+    assert response.status_code == 200
+
+
+def test_reused_pid_does_not_overwrite_old_worker_file(tmp_path, monkeypatch):
+    with override_settings(METRICS_DIR=tmp_path):
+        registry.flush(force=True)
+        first = registry.filename
+        monkeypatch.setattr(registry, "pid", None)
+        registry.flush(force=True)
+        assert registry.filename != first, (
+            "Убедитесь, что файл метрик нового воркера с тем же PID "
+            "не затирает файл прежнего."
+        )
+        assert len(list(tmp_path.glob("*.json"))) == 2
+        call_command("clear_metrics", stdout=StringIO())
+        assert not list(tmp_path.glob("*.json"))
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from blog.cache import page_cache_timeout
+
+
+@pytest.mark.django_db
+def test_anonymous_index_is_served_from_cache(
+        client: Client, post_with_published_location,
+        django_assert_num_queries
+):
+    first = client.get("/")
+    with django_assert_num_queries(0):
+        second = client.get("/")
+    assert second.content == first.content
+
+    post_with_published_location.title = "Новый заголовок"
+    post_with_published_location.save()
+    assert "Новый заголовок" in client.get("/").content.decode("utf-8"), (
+        "Убедитесь, что кэш ленты сбрасывается при изменении публикации."
+    )
+
+
+@pytest.mark.django_db
+def test_page_cache_expires_before_scheduled_post(
+        mixer, user, published_category
+):
+    mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() + timedelta(seconds=30),
+    )
+    assert page_cache_timeout() <= 30, (
+        "Убедитесь, что страница ленты хранится в кэше не дольше, чем до"
+        " ближайшей отложенной публикации."
+    )
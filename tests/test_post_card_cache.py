@@ -0,0 +1,30 @@
+import pytest
+from django.core.cache import cache
+from django.test import Client
+
+from blog.cache import POST_CARD_GENERATION_KEY
+
+
+@pytest.mark.django_db
+def test_post_card_cache_is_reset_on_category_change(
+        user_client: Client, post_with_published_location
+):
+    category = post_with_published_location.category
+    user_client.get("/")
+    generation = cache.get(POST_CARD_GENERATION_KEY)
+    assert generation is not None
+
+    category.title = "Обновлённая категория"
+    category.save()
+    assert cache.get(POST_CARD_GENERATION_KEY) != generation
+    assert category.title in user_client.get("/").content.decode("utf-8"), (
+        "Убедитесь, что карточки публикаций обновляются после изменения"
+        " категории."
+    )
+
+
+@pytest.mark.django_db
+def test_post_card_cache_keeps_generation_on_login(user, client: Client):
+    generation = cache.get_or_set(POST_CARD_GENERATION_KEY, 1, None)
+    client.force_login(user)
+    assert cache.get(POST_CARD_GENERATION_KEY) == generation
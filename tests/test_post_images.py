@@ -0,0 +1,121 @@
+import hashlib
+from datetime import timedelta
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import Client, override_settings
+from django.utils import timezone
+from PIL import Image
+
+from blog import jobs
+from blog.models import ImageJob
+from conftest import get_a_post_get_response_safely
+
+
+def process_image_jobs():
+    call_command("process_image_jobs", "--once", stdout=StringIO())
+
+
+@pytest.mark.django_db
+def test_post_image_renditions(
+        user_client: Client, post_with_published_location
+):
+    assert not post_with_published_location.has_renditions
+    content = get_a_post_get_response_safely(
+        user_client, post_with_published_location.id
+    ).content.decode("utf-8")
+    assert post_with_published_location.image.url in content, (
+        "Убедитесь, что до обработки фото выводится оригинал."
+    )
+
+    process_image_jobs()
+    post_with_published_location.refresh_from_db()
+    assert post_with_published_location.has_renditions, (
+        "Убедитесь, что после загрузки фото создаются его уменьшенные копии."
+    )
+    for key in ("webp", "jpeg"):
+        for width, name in post_with_published_location.renditions[key]:
+            assert post_with_published_location.image.storage.exists(name)
+
+    content = get_a_post_get_response_safely(
+        user_client, post_with_published_location.id
+    ).content.decode("utf-8")
+    assert 'type="image/webp"' in content
+    assert 'loading="lazy"' in content
+    assert post_with_published_location.webp_srcset in content
+
+
+@pytest.mark.django_db
+def test_image_job_strips_exif(post_with_published_location):
+    post = post_with_published_location
+    exif = Image.Exif()
+    exif[0x010F] = "Camera"
+    buffer = BytesIO()
+    Image.new("RGB", (50, 50)).save(buffer, format="JPEG", exif=exif)
+    post.image.save("exif.jpg", buffer, save=True)
+
+    process_image_jobs()
+    post.refresh_from_db()
+    with post.image.open("rb"), Image.open(post.image) as image:
+        assert not image.getexif(), (
+            "Убедитесь, что из загруженного фото удаляются EXIF-данные."
+        )
+
+
+@pytest.mark.django_db
+@override_settings(POST_IMAGE_MAX_PIXELS=10)
+def test_image_job_rejects_huge_images(post_with_published_location):
+    process_image_jobs()
+    post_with_published_location.refresh_from_db()
+    assert not post_with_published_location.image
+    assert ImageJob.objects.filter(status=ImageJob.FAILED).exists()
+
+
+@pytest.mark.django_db
+def test_identical_uploads_share_one_file(
+        mixer, user, published_category, post_with_published_location
+):
+    first = post_with_published_location
+    with first.image.open("rb"):
+        content = first.image.read()
+    second = mixer.blend(
+        "blog.Post", author=user, category=published_category
+    )
+    second.image.save("copy.JPG", ContentFile(content), save=True)
+
+    assert second.image.name == first.image.name, (
+        "Убедитесь, что одинаковые фото сохраняются в один файл."
+    )
+    digest = hashlib.sha256(content).hexdigest()
+    assert first.image.name == f"images/{digest[:2]}/{digest[2:4]}/{digest}.jpg"
+
+
+@pytest.mark.django_db
+def test_stale_running_job_is_reclaimed(post_with_published_location):
+    job = ImageJob.objects.get(post=post_with_published_location)
+    ImageJob.objects.filter(pk=job.pk).update(
+        status=ImageJob.RUNNING,
+        started_at=timezone.now() - timedelta(hours=1),
+    )
+    process_image_jobs()
+    job.refresh_from_db()
+    assert job.status == ImageJob.DONE, (
+        "Убедитесь, что задача, брошенная остановленным обработчиком, "
+        "снова берётся в работу."
+    )
+
+
+@pytest.mark.django_db
+def test_unexpected_error_fails_only_its_job(
+        post_with_published_location, monkeypatch
+):
+    def broken(job):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(jobs, "process_image_job", broken)
+    process_image_jobs()
+    job = ImageJob.objects.get(post=post_with_published_location)
+    assert job.status == ImageJob.FAILED
+    assert "boom" in job.error
@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from blog.cache import page_cache_timeout
+from blog.models import Post, published_cutoff, published_visible_from
+
+
+def test_published_cutoff_is_rounded_down_to_bucket():
+    now = timezone.now()
+    cutoff = published_cutoff(bucket=60)
+    assert cutoff <= now
+    assert (cutoff.second, cutoff.microsecond) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_published_manager_uses_current_time(
+        mixer, user, published_category
+):
+    post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() + timedelta(days=1),
+    )
+    assert not Post.published.filter(pk=post.pk).exists()
+
+    Post.objects.filter(pk=post.pk).update(
+        pub_date=timezone.now() - timedelta(seconds=1)
+    )
+    assert Post.published.filter(pk=post.pk).exists(), (
+        "Убедитесь, что граница публикации вычисляется при каждом запросе."
+    )
+
+
+def test_published_visible_from_is_rounded_up_to_bucket():
+    pub_date = timezone.now().replace(second=10, microsecond=0)
+    assert published_visible_from(pub_date, bucket=60) == (
+        pub_date + timedelta(seconds=50)
+    )
+    assert published_visible_from(pub_date, bucket=0) == pub_date
+
+
+@pytest.mark.django_db
+@override_settings(
+    BLOG_PUBLISHED_CUTOFF_BUCKET=3600, BLOG_PAGE_CACHE_TIMEOUT=7200
+)
+def test_page_cache_expires_when_scheduled_post_becomes_visible(
+        mixer, user, published_category
+):
+    pub_date = timezone.now() + timedelta(seconds=30)
+    mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=pub_date,
+    )
+    seconds_left = (
+        published_visible_from(pub_date) - timezone.now()
+    ).total_seconds()
+    assert seconds_left - 2 <= page_cache_timeout() <= seconds_left, (
+        "Убедитесь, что страница хранится в кэше до момента, когда "
+        "отложенная публикация попадёт в выдачу с учётом округления."
+    )
+
+
+@pytest.mark.django_db
+@override_settings(
+    BLOG_PUBLISHED_CUTOFF_BUCKET=3600, BLOG_PAGE_CACHE_TIMEOUT=7200
+)
+def test_page_cache_expires_for_past_post_hidden_by_bucket(
+        mixer, user, published_category
+):
+    now = timezone.now()
+    cutoff = published_cutoff()
+    # Дата уже прошла, но интервал округления ещё не закрыт.
+    pub_date = cutoff + (now - cutoff) / 2
+    mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=pub_date,
+    )
+    assert not Post.published.exists()
+    seconds_left = (
+        published_visible_from(pub_date) - timezone.now()
+    ).total_seconds()
+    assert page_cache_timeout() <= seconds_left, (
+        "Убедитесь, что страница не хранится в кэше дольше, чем скрыта "
+        "публикация, дата которой уже прошла."
+    )
@@ -0,0 +1,55 @@
+import pytest
+from django.test import Client, override_settings
+
+from blog.query_budget import QueryBudgetExceeded
+from blog.views import IndexView
+
+
+@pytest.fixture
+def many_posts(mixer, user, post_with_published_location):
+    post = post_with_published_location
+    mixer.cycle(15).blend(
+        "blog.Post",
+        author=user,
+        category=post.category,
+        location=post.location,
+        is_published=True,
+    )
+    mixer.cycle(3).blend("blog.Comment", post=post, author=user)
+    return post
+
+
+@pytest.mark.django_db
+def test_pages_stay_within_query_budget(user_client: Client, many_posts):
+    urls = (
+        "/",
+        "/?page=2",
+        f"/category/{many_posts.category.slug}/",
+        f"/profile/{many_posts.author.username}/",
+        f"/posts/{many_posts.id}/",
+        "/search/?q=a",
+    )
+    for url in urls:
+        response = user_client.get(url)
+        assert response.status_code == 200
+        assert "Server-Timing" in response, (
+            "Убедитесь, что в ответе есть заголовок Server-Timing "
+            "с числом SQL-запросов."
+        )
+
+
+@pytest.mark.django_db
+def test_exceeded_budget_raises(client: Client, many_posts, monkeypatch):
+    monkeypatch.setattr(IndexView, "query_budget", 1)
+    with pytest.raises(QueryBudgetExceeded):
+        client.get("/")
+
+
+@pytest.mark.django_db
+@override_settings(QUERY_BUDGET_RAISE=False)
+def test_exceeded_budget_is_logged(
+        client: Client, many_posts, monkeypatch, caplog
+):
+    monkeypatch.setattr(IndexView, "query_budget", 1)
+    assert client.get("/").status_code == 200
+    assert "при бюджете 1" in caplog.text
@@ -0,0 +1,73 @@
+import pytest
+from django.test import Client, override_settings
+
+from blog.models import Post
+from blog.routers import (
+    PRIMARY_COOKIE,
+    PrimaryReplicaRouter,
+    read_from_replica,
+)
+
+REPLICA = "default"
+
+
+@pytest.fixture
+def read_aliases(monkeypatch):
+    """Запоминает, куда роутер направлял чтение."""
+    aliases = []
+    original = PrimaryReplicaRouter.db_for_read
+
+    def spy(self, model, **hints):
+        alias = original(self, model, **hints)
+        aliases.append((model.__name__, alias))
+        return alias
+
+    monkeypatch.setattr(PrimaryReplicaRouter, "db_for_read", spy)
+    return aliases
+
+
+@override_settings(REPLICA_DATABASE="replica")
+def test_router_sends_reads_in_replica_block_to_replica():
+    router = PrimaryReplicaRouter()
+    assert router.db_for_read(Post) is None
+    with read_from_replica():
+        assert router.db_for_read(Post) == "replica"
+        assert router.db_for_write(Post) == "default"
+    assert router.allow_migrate("replica", "blog") is False
+
+
+@pytest.mark.django_db
+@override_settings(REPLICA_DATABASE=REPLICA)
+def test_list_pages_read_from_replica_until_user_writes(
+        read_aliases, user_client: Client, post_with_published_location
+):
+    user_client.get("/")
+    assert ("Post", REPLICA) in read_aliases, (
+        "Убедитесь, что лента читает публикации с реплики."
+    )
+
+    response = user_client.post(
+        f"/posts/{post_with_published_location.id}/comment/",
+        data={"text": "Текст"},
+    )
+    assert PRIMARY_COOKIE in response.cookies
+
+    read_aliases.clear()
+    user_client.get("/")
+    assert read_aliases and all(
+        alias is None for _, alias in read_aliases
+    ), "Убедитесь, что после записи автор читает с основной базы."
+
+
+@pytest.mark.django_db
+@override_settings(REPLICA_DATABASE=REPLICA)
+def test_cached_anonymous_pages_are_rendered_from_primary(
+        read_aliases, client: Client, post_with_published_location
+):
+    assert client.get("/").status_code == 200
+    assert read_aliases and all(
+        alias is None for _, alias in read_aliases
+    ), (
+        "Убедитесь, что страница для кэша читается с основной базы: "
+        "отстающая реплика закэшировала бы устаревшую страницу."
+    )
@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from blog.models import Post
+
+
+@pytest.mark.django_db
+def test_search_finds_published_posts(
+        mixer, user, client: Client, published_category,
+        posts_with_unpublished_category
+):
+    found = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=True, title="Ёжики в тумане",
+        text="Длинный рассказ про <b>туман</b> и ёжиков.",
+        pub_date=timezone.now() - timedelta(hours=1),
+    )
+    hidden = posts_with_unpublished_category[0]
+    Post.objects.filter(pk=hidden.pk).update(title="Туман над рекой")
+
+    response = client.get("/search/", {"q": "туман"})
+    assert response.status_code == 200
+    posts = list(response.context["page_obj"])
+    assert [post.id for post in posts] == [found.id], (
+        "Убедитесь, что поиск выводит только опубликованные посты,"
+        " подходящие под запрос."
+    )
+    content = response.content.decode("utf-8")
+    assert "<mark>туман</mark>" in content
+    assert "<b>туман" not in content
+
+
+@pytest.mark.django_db
+def test_search_tolerates_fts_syntax(client: Client):
+    response = client.get("/search/", {"q": 'AND "( NEAR*'})
+    assert response.status_code == 200
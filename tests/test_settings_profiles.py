@@ -0,0 +1,26 @@
+import importlib
+
+from django.conf import settings
+from django.urls import Resolver404, resolve
+
+
+def test_debug_toolbar_only_in_dev_profile():
+    assert "debug_toolbar" not in settings.INSTALLED_APPS, (
+        "Убедитесь, что debug_toolbar не подключён в основных настройках."
+    )
+    assert not any("debug_toolbar" in name for name in settings.MIDDLEWARE)
+    try:
+        resolve("/__debug__/")
+    except Resolver404:
+        pass
+    else:
+        raise AssertionError(
+            "Убедитесь, что адреса debug_toolbar подключаются "
+            "только в настройках для разработки."
+        )
+
+    dev = importlib.import_module("blogicum.settings_dev")
+    assert "debug_toolbar" in dev.INSTALLED_APPS
+    assert (
+        "debug_toolbar.middleware.DebugToolbarMiddleware" in dev.MIDDLEWARE
+    )
@@ -0,0 +1,38 @@
+import pytest
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.checks import run_checks
+from django.test import Client, override_settings
+from django.utils import timezone
+
+from blog.cache import PAGE_GENERATION_KEY, POST_CARD_GENERATION_KEY
+from blog.models import Post
+
+
+@pytest.mark.django_db
+def test_invalidation_from_another_process_reaches_page_cache(
+        client: Client, post_with_published_location, file_cache
+):
+    post = post_with_published_location
+    assert post.title in client.get("/").content.decode()
+    Post.objects.filter(pk=post.pk).update(
+        title="Изменено в другом процессе", updated_at=timezone.now()
+    )
+    other_worker = FileBasedCache(str(file_cache), {})
+    other_worker.incr(PAGE_GENERATION_KEY)
+    other_worker.incr(POST_CARD_GENERATION_KEY)
+    assert "Изменено в другом процессе" in client.get("/").content.decode(), (
+        "Убедитесь, что сброс кэша страниц в одном процессе виден другим "
+        "при общем кэше."
+    )
+
+
+def test_process_local_cache_is_reported_in_production():
+    with override_settings(DEBUG=False):
+        assert "blog.W001" in [message.id for message in run_checks()], (
+            "Убедитесь, что без общего кэша выдаётся предупреждение."
+        )
+
+
+def test_shared_cache_passes_check(file_cache):
+    with override_settings(DEBUG=False):
+        assert "blog.W001" not in [message.id for message in run_checks()]
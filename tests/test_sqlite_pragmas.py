@@ -0,0 +1,28 @@
+import pytest
+from django.db import connection
+from django.test import override_settings
+
+from blog.db import apply_sqlite_pragmas
+from blog.query_budget import count_queries
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite")
+@pytest.mark.django_db
+@override_settings(SQLITE_PRAGMAS={"cache_size": -1234})
+def test_sqlite_pragmas_are_applied():
+    apply_sqlite_pragmas(sender=None, connection=connection)
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA cache_size")
+        assert cursor.fetchone()[0] == -1234
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite")
+@pytest.mark.django_db
+@override_settings(SQLITE_PRAGMAS={"cache_size": -1234})
+def test_sqlite_pragmas_do_not_count_against_query_budget():
+    with count_queries() as stats:
+        apply_sqlite_pragmas(sender=None, connection=connection)
+    assert stats.count == 0, (
+        "Убедитесь, что прагмы нового соединения не учитываются "
+        "в бюджете SQL-запросов."
+    )
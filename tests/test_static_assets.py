@@ -0,0 +1,68 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.http import HttpResponseNotFound
+from django.templatetags.static import static
+from django.test import RequestFactory, override_settings
+
+from blog.middleware import StaticFilesMiddleware
+from blogicum.settings import STORAGES
+
+STYLESHEET = "css/bootstrap.min.css"
+
+
+@pytest.fixture
+def static_root(tmp_path):
+    storages = {
+        **STORAGES,
+        "staticfiles": {
+            "BACKEND": (
+                "blog.staticfiles.CompressedManifestStaticFilesStorage"
+            ),
+        },
+    }
+    with override_settings(STATIC_ROOT=tmp_path, STORAGES=storages):
+        call_command("collectstatic", interactive=False, stdout=StringIO())
+        yield tmp_path
+
+
+def serve(url, **headers):
+    middleware = StaticFilesMiddleware(lambda request: HttpResponseNotFound())
+    return middleware(RequestFactory().get(url, **headers))
+
+
+def test_hashed_static_is_immutable_and_precompressed(static_root):
+    url = static(STYLESHEET)
+    assert url != f"/static/{STYLESHEET}", (
+        "Убедитесь, что в имени статического файла есть хэш содержимого."
+    )
+    hashed_name = url.removeprefix("/static/")
+    assert (static_root / f"{hashed_name}.gz").exists(), (
+        "Убедитесь, что collectstatic создаёт сжатую копию .gz."
+    )
+
+    response = serve(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+    assert response.status_code == 200
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Content-Type"] == "text/css"
+    assert "immutable" in response["Cache-Control"]
+    assert "Accept-Encoding" in response["Vary"]
+
+    plain = serve(url, HTTP_ACCEPT_ENCODING="gzip;q=0")
+    assert "Content-Encoding" not in plain, (
+        "Убедитесь, что сжатая копия не отдаётся клиенту, "
+        "который её не принимает."
+    )
+    assert int(plain["Content-Length"]) > int(response["Content-Length"])
+
+
+def test_unhashed_static_is_revalidated(static_root):
+    response = serve(f"/static/{STYLESHEET}")
+    assert "immutable" not in response["Cache-Control"]
+    not_modified = serve(
+        f"/static/{STYLESHEET}",
+        HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+    )
+    assert not_modified.status_code == 304
+    assert serve("/static/../manage.py").status_code == 404
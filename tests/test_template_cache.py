@@ -0,0 +1,37 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.template import engines
+from django.test import override_settings
+
+from blogicum.settings import TEMPLATES
+
+CACHED_TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        "APP_DIRS": False,
+        "OPTIONS": {
+            **TEMPLATES[0]["OPTIONS"],
+            "loaders": [
+                ("django.template.loaders.cached.Loader", [
+                    "django.template.loaders.filesystem.Loader",
+                    "django.template.loaders.app_directories.Loader",
+                ]),
+            ],
+        },
+    },
+]
+
+
+@override_settings(TEMPLATES=CACHED_TEMPLATES)
+def test_warm_templates_fills_cached_loader():
+    loader = engines["django"].engine.template_loaders[0]
+    assert not loader.get_template_cache
+    out = StringIO()
+    call_command("warm_templates", stdout=out)
+    for name in ("base.html", "includes/post_card.html", "blog/index.html"):
+        assert name in loader.get_template_cache, (
+            "Убедитесь, что команда warm_templates компилирует "
+            f"шаблон `{name}` заранее."
+        )
+    assert "Скомпилировано шаблонов" in out.getvalue()
@@ -0,0 +1,53 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+
+from blog.template_profiler import profile_templates
+
+
+@pytest.fixture
+def feed(mixer, user, published_category, published_location):
+    return mixer.cycle(3).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=published_location,
+        is_published=True,
+        image="",
+    )
+
+
+@pytest.mark.django_db
+def test_profile_collects_includes(user_client: Client, feed):
+    with profile_templates() as profile:
+        assert user_client.get("/").status_code == 200
+    assert profile.calls["includes/post_card.html"] == len(feed), (
+        "Убедитесь, что профилировщик учитывает каждый include."
+    )
+    assert ("base.html", "includes/post_card.html") in profile.includes
+    for name, cumulative in profile.cumulative.items():
+        assert cumulative >= profile.own[name]
+    assert (
+        "blog/index.html;base.html;includes/post_card.html "
+        in profile.collapsed()
+    )
+
+    calls = dict(profile.calls)
+    user_client.get("/")
+    assert dict(profile.calls) == calls, (
+        "Убедитесь, что вне профилирования время шаблонов не собирается."
+    )
+
+
+@pytest.mark.django_db
+def test_profile_templates_command(feed, tmp_path):
+    collapsed = tmp_path / "stacks.txt"
+    out = StringIO()
+    call_command(
+        "profile_templates", "/", repeat=2, collapsed=collapsed, stdout=out
+    )
+    assert "includes/post_card.html" in out.getvalue()
+    lines = collapsed.read_text().splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
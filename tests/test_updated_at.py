@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from blog.models import Post
+
+
+@pytest.mark.django_db
+def test_last_modified_follows_edits(user, post_with_published_location):
+    post = post_with_published_location
+    Post.objects.filter(pk=post.pk).update(
+        updated_at=timezone.now() - timedelta(days=1)
+    )
+    before = Post.objects.last_modified(author=user)
+
+    post.title = "Новый заголовок"
+    post.save()
+    post.refresh_from_db()
+    assert post.updated_at > before
+    assert Post.objects.last_modified(author=user) == post.updated_at, (
+        "Убедитесь, что `Post.objects.last_modified()` возвращает время"
+        " последнего изменения публикаций."
+    )
+    assert Post.objects.last_modified(pk=-1) is None
+
+
+@pytest.mark.django_db
+def test_new_comment_touches_post(
+        user_client: Client, post_with_published_location
+):
+    post = post_with_published_location
+    before = post.updated_at
+    user_client.post(f"/posts/{post.id}/comment/", data={"text": "Текст"})
+    post.refresh_from_db()
+    assert post.updated_at > before
+    comment = post.comments.get()
+    assert comment.updated_at >= comment.created_at
+
+
+@pytest.mark.django_db
+def test_only_username_change_touches_author_posts(
+        user, post_with_published_location
+):
+    post = post_with_published_location
+    before = timezone.now() - timedelta(days=1)
+    Post.objects.filter(pk=post.pk).update(updated_at=before)
+
+    user.set_password("Новый-пароль-123")
+    user.email = "new@example.com"
+    user.save()
+    post.refresh_from_db()
+    assert post.updated_at == before, (
+        "Убедитесь, что смена пароля или почты автора не меняет "
+        "`updated_at` его публикаций."
+    )
+
+    user.username = "renamed"
+    user.save()
+    post.refresh_from_db()
+    assert post.updated_at > before, (
+        "Убедитесь, что смена имени автора меняет `updated_at` его "
+        "публикаций: имя выводится в карточках."
+    )